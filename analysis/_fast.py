@@ -0,0 +1,125 @@
+"""
+Per-letter scoring kernels for analysis/measure_difficulty.py.
+
+Each scorer takes the word index arrays, the indices of the surviving
+candidates and a bitmask of letters to skip (bit c set for letter c,
+0 = 'a'), and returns a length-26 int64 array of per-letter scores.
+Skipped letters score 0; the caller applies its own tie-break.
+
+If numba is installed the loops below are JIT-compiled (and cached next to
+this file); otherwise equivalent NumPy reductions are used instead.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy reductions
+    njit = None
+
+# Info-gain uses a dense 2^L partition table up to this word length and
+# sorts the position masks for longer words
+MAX_TABLE_BITS = 16
+
+
+def sum_rows(matrix: np.ndarray, alive: np.ndarray, excluded: int) -> np.ndarray:
+    """Per-letter sums of the alive rows of an N x 26 matrix."""
+    totals = np.zeros(26, dtype=np.int64)
+    for k in range(alive.shape[0]):
+        row = matrix[alive[k]]
+        for c in range(26):
+            totals[c] += row[c]
+    for c in range(26):
+        if excluded >> c & 1:
+            totals[c] = 0
+    return totals
+
+
+def score_freq_raw(counts: np.ndarray, alive: np.ndarray, excluded: int) -> np.ndarray:
+    """Occurrences of each letter across the candidates, duplicates included."""
+    return sum_rows(counts, alive, excluded)
+
+
+def score_coverage(
+    presence: np.ndarray, alive: np.ndarray, excluded: int
+) -> np.ndarray:
+    """Number of candidates containing each letter at least once."""
+    return sum_rows(presence, alive, excluded)
+
+
+def score_info_gain(
+    pos_masks: np.ndarray, alive: np.ndarray, excluded: int, L: int
+) -> np.ndarray:
+    """Sum of squared partition sizes when splitting candidates by position mask."""
+    totals = np.zeros(26, dtype=np.int64)
+    n = alive.shape[0]
+    if L <= MAX_TABLE_BITS:
+        table = np.zeros(1 << L, dtype=np.int64)
+        for c in range(26):
+            if excluded >> c & 1:
+                continue
+            pm = pos_masks[c]
+            score = 0
+            for k in range(n):
+                m = pm[alive[k]]
+                # (x + 1)^2 - x^2 = 2x + 1, so the sum of squares accumulates
+                # as partitions grow
+                score += 2 * table[m] + 1
+                table[m] += 1
+            for k in range(n):
+                table[pm[alive[k]]] = 0
+            totals[c] = score
+    else:
+        keys = np.empty(n, dtype=pos_masks.dtype)
+        for c in range(26):
+            if excluded >> c & 1:
+                continue
+            pm = pos_masks[c]
+            for k in range(n):
+                keys[k] = pm[alive[k]]
+            keys.sort()
+            score = 0
+            run = 0
+            for k in range(n):
+                if k > 0 and keys[k] != keys[k - 1]:
+                    score += run * run
+                    run = 0
+                run += 1
+            totals[c] = score + run * run
+    return totals
+
+
+if njit is not None:
+    sum_rows = njit(cache=True)(sum_rows)
+    score_freq_raw = njit(cache=True)(score_freq_raw)
+    score_coverage = njit(cache=True)(score_coverage)
+    score_info_gain = njit(cache=True)(score_info_gain)
+
+else:
+    _LETTER_BITS = np.arange(26)
+
+    def _excluded_columns(excluded: int) -> np.ndarray:
+        return (excluded >> _LETTER_BITS) & 1 == 1
+
+    def sum_rows(matrix: np.ndarray, alive: np.ndarray, excluded: int) -> np.ndarray:
+        # One contiguous reduction over the surviving rows
+        totals = matrix[alive].sum(axis=0, dtype=np.int64)
+        totals[_excluded_columns(excluded)] = 0
+        return totals
+
+    def score_info_gain(
+        pos_masks: np.ndarray, alive: np.ndarray, excluded: int, L: int
+    ) -> np.ndarray:
+        """Sum of squared partition sizes when splitting candidates by position mask."""
+        totals = np.zeros(26, dtype=np.int64)
+        keys = pos_masks[:, alive]
+        for c in np.flatnonzero(~_excluded_columns(excluded)):
+            if L <= MAX_TABLE_BITS:
+                # The position mask indexes its partition directly
+                sizes = np.bincount(keys[c])
+            else:
+                _, sizes = np.unique(keys[c], return_counts=True)
+            totals[c] = int(np.dot(sizes, sizes))
+        return totals
@@ -8,6 +8,9 @@ analysis/difficulty_report.tsv (default: wrong_coverage).
 - Writes a TSV with columns: word, metric, label
 - Optionally emits a Python snippet ENGLISH_WORDS_RECLASSIFIED for pasting
   into datasets.py
+- With --metrics, reads the report once and bins several metrics in parallel,
+  writing one output (and snippet) per metric with the metric name appended
+  to the file stem.
 
 Usage:
   uv run analysis/bin_difficulty.py \
@@ -15,89 +18,194 @@ Usage:
     --metric wrong_coverage \
     --output analysis/difficulty_binned.tsv \
     --emit-snippet analysis/reclassified_from_coverage.py
+
+  uv run analysis/bin_difficulty.py \
+    --metrics wrong_coverage,wrong_freq_raw,wrong_info_gain \
+    --output analysis/difficulty_binned.tsv
 """
 from __future__ import annotations
 
 import argparse
 import csv
 import math
+import os
 import pathlib
-from typing import Dict, List, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 LABELS = ["v_easy", "easy", "medium", "hard", "v_hard"]
 
 
-def read_metric(input_path: pathlib.Path, metric: str, fallback_metric: Optional[str]) -> Dict[str, float]:
-    """Read word -> metric value. If metric empty and fallback provided, try fallback."""
-    out: Dict[str, float] = {}
+def _to_float(cell: Optional[str]) -> Optional[float]:
+    """Parse a TSV cell, returning None for empty or non-numeric values."""
+    if not cell:
+        return None
+    try:
+        # float() already ignores surrounding whitespace
+        return float(cell)
+    except ValueError:
+        return None
+
+
+def read_metrics(
+    input_path: pathlib.Path, metrics: Sequence[str], fallback_metric: Optional[str]
+) -> Dict[str, Dict[str, float]]:
+    """Read metric -> (word -> value) for several metrics in a single pass.
+
+    If a metric is empty for a row and fallback provided, try fallback.
+    """
+    out: Dict[str, Dict[str, float]] = {metric: {} for metric in metrics}
     with input_path.open('r', encoding='utf-8', newline='') as f:
-        reader = csv.DictReader(f, delimiter='\t')
-        if reader.fieldnames is None or 'word' not in reader.fieldnames:
+        # Plain reader with column indices resolved once from the header,
+        # rather than a dict per row
+        reader = csv.reader(f, delimiter='\t')
+        header = next(reader, None)
+        if header is None or 'word' not in header:
             raise ValueError("Input TSV must include a 'word' column")
+        word_col = header.index('word')
+        fb_col = header.index(fallback_metric) if fallback_metric in header else None
+        cols = [
+            (header.index(metric) if metric in header else None, metric_map)
+            for metric, metric_map in out.items()
+        ]
         for row in reader:
-            w = (row.get('word') or '').strip().lower()
+            n = len(row)
+            w = row[word_col].strip().lower() if word_col < n else ''
             if not w:
                 continue
-            val_str = (row.get(metric) or '').strip()
-            v: Optional[float] = None
-            if val_str:
-                try:
-                    v = float(val_str)
-                except ValueError:
-                    v = None
-            if v is None and fallback_metric:
-                fb_str = (row.get(fallback_metric) or '').strip()
-                if fb_str:
-                    try:
-                        v = float(fb_str)
-                    except ValueError:
-                        v = None
-            if v is not None and not math.isnan(v):
-                out[w] = v
-    if not out:
-        raise ValueError(f"No numeric values found for metric '{metric}'")
+            for col, metric_map in cols:
+                v = _to_float(row[col]) if col is not None and col < n else None
+                if v is None and fb_col is not None and fb_col < n:
+                    v = _to_float(row[fb_col])
+                if v is not None and not math.isnan(v):
+                    metric_map[w] = v
+    for metric, metric_map in out.items():
+        if not metric_map:
+            raise ValueError(f"No numeric values found for metric '{metric}'")
     return out
 
 
-def compute_quantile_thresholds(values: List[float], bins: int) -> List[float]:
+def read_metric(input_path: pathlib.Path, metric: str, fallback_metric: Optional[str]) -> Dict[str, float]:
+    """Read word -> metric value. If metric empty and fallback provided, try fallback."""
+    return read_metrics(input_path, [metric], fallback_metric)[metric]
+
+
+def compute_quantile_thresholds(values: Union[Sequence[float], np.ndarray], bins: int) -> List[float]:
     if bins < 2:
         raise ValueError("bins must be >= 2")
-    s = sorted(values)
-    if not s:
+    if len(values) == 0:
         return []
-    def percentile(pct: float) -> float:
-        if pct <= 0:
-            return s[0]
-        if pct >= 100:
-            return s[-1]
-        rank = (pct / 100.0) * (len(s) - 1)
-        lo = int(rank)
-        hi = min(len(s) - 1, lo + 1)
-        if lo == hi:
-            return s[lo]
-        frac = rank - lo
-        return s[lo] * (1 - frac) + s[hi] * frac
-    step = 100.0 / bins
-    cuts = [percentile(step * k) for k in range(1, bins)]
+    # No copy when handed a float64 array; np.quantile partitions rather than fully sorting
+    arr = np.asarray(values, dtype=np.float64)
+    # Linear interpolation between closest ranks
+    cuts = np.quantile(arr, np.arange(1, bins) / bins, method="linear")
     # Ensure non-decreasing
-    for i in range(1, len(cuts)):
-        if cuts[i] < cuts[i-1]:
-            cuts[i] = cuts[i-1]
-    return cuts
+    np.maximum.accumulate(cuts, out=cuts)
+    return cuts.tolist()
+
+
+def _uniform_step(thresholds: np.ndarray) -> Optional[float]:
+    """Return the common spacing if the thresholds are equispaced, else None."""
+    if len(thresholds) < 2 or not np.isfinite(thresholds).all():
+        return None
+    diffs = np.diff(thresholds)
+    step = float(diffs.mean())
+    if step <= 0 or float(np.ptp(diffs)) > 1e-6 * step:
+        return None
+    return step
+
+
+def classify(values: np.ndarray, thresholds: List[float], labels: List[str]) -> List[str]:
+    thr = np.asarray(thresholds, dtype=np.float64)
+    # The arithmetic path needs finite values: inf/NaN have no integer bin
+    step = _uniform_step(thr) if np.isfinite(values).all() else None
+    if step is None:
+        # Use left-side search so equality stays in the lower bin
+        idx = np.searchsorted(thr, values, side="left")
+    else:
+        # Equispaced cuts: the bin is (v - lo) / step rounded up, which counts
+        # the cuts strictly below v. Nudge by one where float rounding landed
+        # a value on the wrong side of a cut, so results match the search.
+        n = len(thr)
+        idx = np.ceil((values - thr[0]) / step).astype(np.intp)
+        np.clip(idx, 0, n, out=idx)
+        idx -= (idx > 0) & (thr[np.maximum(idx - 1, 0)] >= values)
+        idx += (idx < n) & (thr[np.minimum(idx, n - 1)] < values)
+    np.clip(idx, 0, len(labels) - 1, out=idx)
+    return np.asarray(labels)[idx].tolist()
+
+
+def bin_metric(
+    metric: str,
+    metric_map: Dict[str, float],
+    bins: int,
+    out_path: pathlib.Path,
+    snippet_path: Optional[pathlib.Path] = None,
+) -> Tuple[int, List[float]]:
+    """Bin one metric and write its TSV (and optional snippet).
+
+    Returns the number of rows written and the thresholds used.
+    """
+    # Sort once by word; the same value array feeds thresholds and labels
+    items = sorted(metric_map.items())
+    words = [w for w, _ in items]
+    vals = np.fromiter((v for _, v in items), dtype=np.float64, count=len(items))
+    thresholds = compute_quantile_thresholds(vals, bins=bins)
 
+    # Build labeled rows
+    label_col = classify(vals, thresholds, LABELS)
+    labeled: List[tuple[str, str, float]] = list(zip(words, label_col, vals.tolist()))
+    rows: List[List[str]] = [[w, f"{v:.3f}", label] for w, label, v in labeled]
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open('w', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        f.write(f"word\t{metric}\tlabel\n")
+        for r in rows:
+            f.write("\t".join(r) + "\n")
+
+    if snippet_path is not None:
+        snippet_path.parent.mkdir(parents=True, exist_ok=True)
+        # Group by label order; words were classified in alphabetical order,
+        # so each bucket is already sorted
+        order_index = {lab: i for i, lab in enumerate(LABELS)}
+        buckets: List[List[str]] = [[] for _ in LABELS]
+        for w, label, _ in labeled:
+            buckets[order_index[label]].append(w)
+        parts = [
+            "# Auto-generated by analysis/bin_difficulty.py\n",
+            "from hangman_bench.datasets import WordEntry\n\n",
+            "ENGLISH_WORDS_RECLASSIFIED = [\n",
+        ]
+        for label, bucket in zip(LABELS, buckets):
+            parts.extend(f"    WordEntry(\"{w}\", \"{label}\"),\n" for w in bucket)
+        parts.append("]\n")
+        snippet_path.write_text("".join(parts), encoding='utf-8')
 
-def classify(value: float, thresholds: List[float], labels: List[str]) -> str:
-    # Use left-bisect so equality stays in the lower bin
-    import bisect
-    idx = bisect.bisect_left(thresholds, value)
-    idx = max(0, min(idx, len(labels) - 1))
-    return labels[idx]
+    return len(rows), thresholds
+
+
+def _with_metric_suffix(path: pathlib.Path, metric: str) -> pathlib.Path:
+    return path.with_name(f"{path.stem}_{metric}{path.suffix}")
+
+
+def _report(count: int, thresholds: List[float], out_path: pathlib.Path, snippet_path: Optional[pathlib.Path]) -> None:
+    print(f"Wrote {count} rows to {out_path}")
+    print("Thresholds used (interior cuts): " + ", ".join(f"{t:.3f}" for t in thresholds))
+    if snippet_path is not None:
+        print(f"Snippet written to: {snippet_path}")
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Bin words into difficulty tiers using quantiles")
     parser.add_argument("--input", default="analysis/difficulty_report.tsv", help="Path to difficulty report TSV")
     parser.add_argument("--metric", default="wrong_coverage", help="Metric column to use (default: wrong_coverage)")
+    parser.add_argument(
+        "--metrics",
+        default=None,
+        help="Comma-separated metric columns to bin in parallel (overrides --metric; outputs get a _<metric> suffix)",
+    )
     parser.add_argument("--fallback-metric", default="wrong_freq_raw", help="Fallback metric column if primary is missing")
     parser.add_argument("--bins", type=int, default=5, help="Number of bins (default: 5)")
     parser.add_argument("--output", default="analysis/difficulty_binned.tsv", help="Path to write binned TSV")
@@ -106,43 +214,32 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     in_path = pathlib.Path(args.input)
     out_path = pathlib.Path(args.output)
-
-    metric_map = read_metric(in_path, args.metric, args.fallback_metric)
-    values = list(metric_map.values())
-    thresholds = compute_quantile_thresholds(values, bins=args.bins)
-
-    # Build labeled rows
-    rows: List[List[str]] = []
-    labeled: List[tuple[str, str, float]] = []
-    for w, v in sorted(metric_map.items()):
-        label = classify(v, thresholds, LABELS)
-        rows.append([w, f"{v:.3f}", label])
-        labeled.append((w, label, v))
-
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open('w', encoding='utf-8', newline='') as f:
-        writer = csv.writer(f, delimiter='\t')
-        writer.writerow(["word", args.metric, "label"])
-        for r in rows:
-            writer.writerow(r)
-
-    print(f"Wrote {len(rows)} rows to {out_path}")
-    print("Thresholds used (interior cuts): " + ", ".join(f"{t:.3f}" for t in thresholds))
-
-    if args.emit_snippet:
-        snippet_path = pathlib.Path(args.emit_snippet)
-        snippet_path.parent.mkdir(parents=True, exist_ok=True)
-        # Sort by label order then alphabetically
-        order_index = {lab: i for i, lab in enumerate(LABELS)}
-        labeled.sort(key=lambda x: (order_index[x[1]], x[0]))
-        with snippet_path.open('w', encoding='utf-8') as sf:
-            sf.write("# Auto-generated by analysis/bin_difficulty.py\n")
-            sf.write("from hangman_bench.datasets import WordEntry\n\n")
-            sf.write("ENGLISH_WORDS_RECLASSIFIED = [\n")
-            for w, label, _ in labeled:
-                sf.write(f"    WordEntry(\"{w}\", \"{label}\"),\n")
-            sf.write("]\n")
-        print(f"Snippet written to: {snippet_path}")
+    snippet_path = pathlib.Path(args.emit_snippet) if args.emit_snippet else None
+
+    if not args.metrics:
+        metric_map = read_metric(in_path, args.metric, args.fallback_metric)
+        count, thresholds = bin_metric(args.metric, metric_map, args.bins, out_path, snippet_path)
+        _report(count, thresholds, out_path, snippet_path)
+        return 0
+
+    metrics = [m.strip() for m in args.metrics.split(",") if m.strip()]
+    metric_maps = read_metrics(in_path, metrics, args.fallback_metric)
+    paths = {
+        metric: (
+            _with_metric_suffix(out_path, metric),
+            _with_metric_suffix(snippet_path, metric) if snippet_path else None,
+        )
+        for metric in metrics
+    }
+    with ProcessPoolExecutor(max_workers=min(len(metrics), os.cpu_count() or 1)) as pool:
+        futures = {
+            metric: pool.submit(bin_metric, metric, metric_maps[metric], args.bins, *paths[metric])
+            for metric in metrics
+        }
+        for metric, future in futures.items():
+            count, thresholds = future.result()
+            print(f"[{metric}]")
+            _report(count, thresholds, *paths[metric])
 
     return 0
 
@@ -15,47 +15,42 @@ from __future__ import annotations
 
 import argparse
 import csv
-from typing import List
+import itertools
+from typing import Iterable, List, Set
 
 
-def read_words(input_path: str) -> List[str]:
-    words: List[str] = []
-    with open(input_path, "r", encoding="utf-8", newline="") as f:
-        # Try DictReader first to honor header names
-        sniffer = csv.Sniffer()
-        # We know it's TSV, but DictReader needs fieldnames; we manually set delimiter
-        reader = csv.DictReader(f, delimiter="\t")
-        if reader.fieldnames and "word" in reader.fieldnames:
-            for row in reader:
-                w = (row.get("word") or "").strip().lower()
-                if w:
-                    words.append(w)
-            return words
+def extract(input_path: str, output_path: str) -> int:
+    """Stream unique words from the input TSV to the output file in one pass.
 
-    # Fallback: standard reader, first column only
-    with open(input_path, "r", encoding="utf-8", newline="") as f2:
-        reader2 = csv.reader(f2, delimiter="\t")
-        first = True
-        for row in reader2:
-            if not row:
+    Returns the number of unique words written.
+    """
+    seen: Set[str] = set()
+    with open(input_path, "r", encoding="utf-8", newline="") as f, open(
+        output_path, "w", encoding="utf-8"
+    ) as out:
+        reader = csv.reader(f, delimiter="\t")
+        # Skip leading blank lines, as the first row may be the header
+        header = next((row for row in reader if row), None)
+        if header is None:
+            return 0
+        # Honor a "word" header column (any case or padding); otherwise the
+        # first row is data too
+        cols = [h.strip().lower() for h in header]
+        if "word" in cols:
+            col = cols.index("word")
+            rows: Iterable[List[str]] = reader
+        else:
+            col = 0
+            rows = itertools.chain([header], reader)
+        for row in rows:
+            if len(row) <= col:
                 continue
-            if first and row[0].strip().lower() == "word":
-                first = False
-                continue
-            first = False
-            w = row[0].strip().lower()
-            if w:
-                words.append(w)
-    return words
-
-
-def write_unique(words: List[str], output_path: str) -> None:
-    seen = set()
-    with open(output_path, "w", encoding="utf-8") as out:
-        for w in words:
-            if w not in seen:
+            w = row[col].strip().lower()
+            if w and w not in seen:
                 seen.add(w)
-                out.write(w + "\n")
+                out.write(w)
+                out.write("\n")
+    return len(seen)
 
 
 def main() -> int:
@@ -64,10 +59,9 @@ def main() -> int:
     parser.add_argument("--output", required=True, help="Path to write word list (one word per line)")
     args = parser.parse_args()
 
-    words = read_words(args.input)
-    write_unique(words, args.output)
+    count = extract(args.input, args.output)
 
-    print(f"Wrote {len(set(words))} unique words to {args.output}")
+    print(f"Wrote {count} unique words to {args.output}")
     return 0
 
 
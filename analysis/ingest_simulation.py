@@ -7,9 +7,11 @@ Usage:
   python scripts/ingest_simulation.py --input SimulationData.txt --output SimulationData_parsed.tsv
 
 Notes:
-- The input file is large (~50MB). This script reads it into memory once and uses
-  a regex to extract pairs of the form {"word", {n1, n2, ..., nk}}. This is acceptable
-  for this size. If needed, a streaming parser can be implemented later.
+- The input file is large (~50MB). This script memory-maps it and streams matches
+  of a bytes regex extracting pairs of the form {"word", {n1, n2, ..., nk}}, writing
+  each row as it is parsed rather than holding the whole file or all rows in memory.
+- If numba is installed, each numbers list is parsed by a JIT-compiled byte
+  scanner into a NumPy array; otherwise a compiled regex is used.
 - Output is TSV with columns: word, wrong_guesses, mean_wrong_guesses
   where wrong_guesses is a comma-separated list inside square brackets.
 - If the --input file does not exist, the script will download the source ZIP from
@@ -19,19 +21,28 @@ Notes:
 from __future__ import annotations
 
 import argparse
-import csv
+import mmap
 import os
 import re
 import shutil
 import tempfile
 import urllib.request
 import zipfile
-from statistics import mean
-from typing import Iterable, List, Tuple
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the regex parser
+    njit = None
 
 # Regex to capture entries like {"word", {1, 2, 3}}
-# DOTALL to allow numbers list across multiple lines
-ENTRY_REGEX = re.compile(r"\{\s*\"([^\"]+)\"\s*,\s*\{([^}]*)\}\s*\}", re.DOTALL)
+# Bytes pattern so it can scan a memory-mapped file directly. The negated
+# character classes already span newlines, so no DOTALL flag is needed.
+ENTRY_REGEX = re.compile(rb'\{\s*"([^"]+)"\s*,\s*\{([^}]*)\}\s*\}')
+# Integers inside an entry's numbers list (optional minus not expected but handled)
+NUM_RE = re.compile(rb"-?\d+")
 
 # Source ZIP containing SimulationData.txt
 SIMULATION_ZIP_URL = (
@@ -53,73 +64,103 @@ def download_and_extract_simulation_data(dest_path: str) -> str:
     if dest_dir:
         os.makedirs(dest_dir, exist_ok=True)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        zip_path = os.path.join(tmpdir, "SimulationData.zip")
-        urllib.request.urlretrieve(SIMULATION_ZIP_URL, zip_path)
-
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(tmpdir)
-
-        # Find SimulationData.txt within extracted contents
-        candidate = None
-        for root, _dirs, files in os.walk(tmpdir):
-            if "SimulationData.txt" in files:
-                candidate = os.path.join(root, "SimulationData.txt")
-                break
-
-        if candidate is None:
-            raise FileNotFoundError(
-                "SimulationData.txt not found inside downloaded ZIP archive"
-            )
-
-        shutil.copyfile(candidate, dest_path)
-        return dest_path
-
-
-def parse_simulation_data(text: str) -> Iterable[Tuple[str, List[int]]]:
+    # Stream the download into a spooled buffer (in memory unless it grows
+    # large) and copy the one entry we need straight to its destination
+    with tempfile.SpooledTemporaryFile(max_size=64 << 20) as spool:
+        with urllib.request.urlopen(SIMULATION_ZIP_URL) as response:
+            shutil.copyfileobj(response, spool, length=1 << 20)
+        spool.seek(0)
+
+        with zipfile.ZipFile(spool, "r") as zf:
+            entries = [
+                n for n in zf.namelist() if n.rsplit("/", 1)[-1] == "SimulationData.txt"
+            ]
+            if not entries:
+                raise FileNotFoundError(
+                    "SimulationData.txt not found inside downloaded ZIP archive"
+                )
+            with zf.open(entries[0]) as src, open(dest_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+
+    return dest_path
+
+
+def _scan_ints(buf: np.ndarray) -> np.ndarray:
+    """Parse the integers in a byte buffer like b"1, 2,\n 3" into an int64 array."""
+    out = np.empty(len(buf) // 2 + 1, dtype=np.int64)
+    n = 0
+    value = 0
+    in_number = False
+    negative = False
+    for i in range(len(buf)):
+        b = int(buf[i])
+        if 48 <= b <= 57:  # 0-9
+            value = value * 10 + (b - 48)
+            in_number = True
+        else:
+            if in_number:
+                out[n] = -value if negative else value
+                n += 1
+            value = 0
+            in_number = False
+            negative = b == 45  # '-' applies to the digits that follow it
+    if in_number:
+        out[n] = -value if negative else value
+        n += 1
+    return out[:n]
+
+
+if njit is not None:
+    _scan_ints_jit = njit(cache=True)(_scan_ints)
+
+    def _parse_ints(blob: bytes) -> np.ndarray:
+        return _scan_ints_jit(np.frombuffer(blob, dtype=np.uint8))
+
+else:
+
+    def _parse_ints(blob: bytes) -> np.ndarray:
+        return np.fromiter(map(int, NUM_RE.findall(blob)), dtype=np.int64)
+
+
+def parse_simulation_data(
+    data: Union[bytes, mmap.mmap],
+) -> Iterable[Tuple[str, np.ndarray]]:
     """Parse the SimulationData.txt content.
 
     Args:
-        text: Full text content of SimulationData.txt
+        data: Raw bytes (or a memory map) of SimulationData.txt
 
     Yields:
-        Tuples of (word, list_of_wrong_guess_counts)
+        Tuples of (word, array_of_wrong_guess_counts)
     """
-    for match in ENTRY_REGEX.finditer(text):
-        word = match.group(1)
-        numbers_blob = match.group(2)
-        # Split by commas and parse integers, ignoring whitespace and newlines
-        nums: List[int] = []
-        for part in numbers_blob.split(','):
-            s = part.strip()
-            if not s:
-                continue
-            # Some files may contain trailing comments or braces; be defensive
-            # Keep only leading numeric portion (optional minus not expected but handled)
-            m = re.match(r"^(-?\d+)", s)
-            if m:
-                try:
-                    nums.append(int(m.group(1)))
-                except ValueError:
-                    continue
-        yield word, nums
-
-
-def write_tsv(rows: Iterable[Tuple[str, List[int]]], out_path: str) -> None:
+    for match in ENTRY_REGEX.finditer(data):
+        word = match.group(1).decode("utf-8", errors="ignore")
+        # Single scan over the numbers list, ignoring commas, whitespace and newlines
+        yield word, _parse_ints(match.group(2))
+
+
+def write_tsv(rows: Iterable[Tuple[str, np.ndarray]], out_path: str) -> int:
     """Write parsed rows to a TSV file with mean.
 
     Columns: word, wrong_guesses, mean_wrong_guesses
     wrong_guesses is a comma-separated list inside square brackets.
+
+    Returns:
+        The number of rows written
     """
+    count = 0
     os.makedirs(os.path.dirname(out_path), exist_ok=True) if os.path.dirname(out_path) else None
-    with open(out_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f, delimiter='\t')
-        writer.writerow(["word", "wrong_guesses", "mean_wrong_guesses"])
+    # Words and formatted numbers never contain tabs or newlines, so rows are
+    # joined directly rather than going through csv.writer quoting
+    with open(out_path, 'w', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        f.write("word\twrong_guesses\tmean_wrong_guesses\n")
         for word, nums in rows:
-            m = float(mean(nums)) if nums else 0.0
+            m = float(nums.mean()) if len(nums) else 0.0
             # Format list similar to the original (comma + space)
-            nums_str = f"[{', '.join(str(n) for n in nums)}]"
-            writer.writerow([word, nums_str, f"{m:.3f}"])
+            nums_str = "[" + ", ".join(map(str, nums.tolist())) + "]"
+            f.write(f"{word}\t{nums_str}\t{m:.3f}\n")
+            count += 1
+    return count
 
 
 def main() -> None:
@@ -135,14 +176,15 @@ def main() -> None:
         print(f"Input file not found at {in_path}. Downloading and extracting...")
         download_and_extract_simulation_data(in_path)
 
-    # Read entire file (approx 50MB)
-    with open(in_path, 'r', encoding='utf-8', errors='ignore') as f:
-        text = f.read()
-
-    rows = list(parse_simulation_data(text))
-    write_tsv(rows, out_path)
+    if os.path.getsize(in_path) == 0:
+        # An empty (e.g. interrupted) download cannot be mapped; it has no rows
+        count = write_tsv([], out_path)
+    else:
+        # Memory-map the file (approx 50MB) and stream rows straight to the output
+        with open(in_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            count = write_tsv(parse_simulation_data(mm), out_path)
 
-    print(f"Wrote {len(rows)} rows to {out_path}")
+    print(f"Wrote {count} rows to {out_path}")
 
 
 if __name__ == "__main__":
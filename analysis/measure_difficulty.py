@@ -22,19 +22,33 @@ Usage:
     --wordlist analysis/wordlist.txt \
     --output analysis/difficulty_report.tsv
 
-This script uses only the Python standard library.
+Per-letter scoring runs in the kernels in analysis/_fast.py, which are
+JIT-compiled when numba is installed and use NumPy reductions otherwise.
+Words are measured in parallel across --workers processes (default: all CPUs).
 """
 
 import argparse
 import importlib.util
 import math
+import os
 import pathlib
-import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# isort: split
+# Local kernels module next to this script (its directory is on sys.path)
+from _fast import score_coverage, score_freq_raw, score_info_gain, sum_rows
 
 ALPHABET = [chr(c) for c in range(ord("a"), ord("z") + 1)]
+ALL_LETTERS = (1 << len(ALPHABET)) - 1
+LETTER_BITS = np.arange(len(ALPHABET))
 REPO_ROOT = pathlib.Path(__file__).resolve().parents[1]
+# Position masks hold one bit per letter position; longer words get no solver
+# columns, like lengths missing from the dictionary
+MAX_WORD_LENGTH = 64
 
 
 @dataclass
@@ -43,6 +57,26 @@ class SolverResult:
     total_guesses: int
 
 
+@dataclass
+class WordIndex:
+    """Bitmask encoding of a dictionary of same-length words.
+
+    pos_masks[c, i] has bit p set if letter c (0 = 'a') occurs at position p
+    (uint32, or uint64 for words longer than 32 letters)
+    of word i. presence[i, c] is 1 if letter c occurs in word i and
+    counts[i, c] is the number of times it does.
+    first_guesses caches each chooser's opening guess, which only depends on
+    the dictionary.
+    """
+
+    words: List[str]
+    length: int
+    pos_masks: np.ndarray
+    presence: np.ndarray
+    counts: np.ndarray
+    first_guesses: Dict[Callable, Optional[str]] = field(default_factory=dict)
+
+
 def load_dataset_words(datasets_path: pathlib.Path) -> List[str]:
     """Load ENGLISH_WORDS from datasets.py via file path to avoid package imports."""
     spec = importlib.util.spec_from_file_location(
@@ -64,8 +98,8 @@ def load_dataset_words(datasets_path: pathlib.Path) -> List[str]:
 
 
 def load_wordlist(path: pathlib.Path) -> List[str]:
-    with path.open("r", encoding="utf-8", errors="ignore") as f:
-        return [line.strip().lower() for line in f if line.strip()]
+    # One word per line; lowercase the whole file at once
+    return path.read_text(encoding="utf-8", errors="ignore").lower().split()
 
 
 def build_length_index(words: List[str]) -> Dict[int, List[str]]:
@@ -75,171 +109,295 @@ def build_length_index(words: List[str]) -> Dict[int, List[str]]:
     return idx
 
 
+def build_word_index(words: List[str], length: int) -> WordIndex:
+    n = len(words)
+    char_bytes = np.frombuffer(
+        "".join(words).encode("latin-1", "replace"), dtype=np.uint8
+    ).reshape(n, length)
+    codes = char_bytes.astype(np.intp) - 97
+    valid = (codes >= 0) & (codes < 26)
+    rows = np.arange(n)
+    if length > MAX_WORD_LENGTH:
+        raise ValueError(
+            f"words longer than {MAX_WORD_LENGTH} letters cannot be indexed"
+        )
+    mask_type = np.uint32 if length <= 32 else np.uint64
+    pos_masks = np.zeros((len(ALPHABET), n), dtype=mask_type)
+    for p in range(length):
+        ok = valid[:, p]
+        pos_masks[codes[ok, p], rows[ok]] |= mask_type(1 << p)
+    # Letter histogram per word in one pass over the flattened character array
+    cells = (rows[:, None] * len(ALPHABET) + codes)[valid]
+    counts = np.bincount(cells, minlength=n * len(ALPHABET)).reshape(n, len(ALPHABET))
+    return WordIndex(
+        words=words,
+        length=length,
+        pos_masks=pos_masks,
+        presence=(counts > 0).astype(np.uint8),
+        counts=counts.astype(np.uint8),
+    )
+
+
+def letters_mask(letters: Iterable[str]) -> int:
+    """Bitmask of the a-z letters in letters; anything else is ignored."""
+    mask = 0
+    for ch in letters:
+        if "a" <= ch <= "z":
+            mask |= 1 << (ord(ch) - 97)
+    return mask
+
+
+def board_mask(board: bytes) -> int:
+    """Bitmask of the a-z letters revealed on board, ignoring b'.'."""
+    mask = 0
+    for b in board:
+        if 97 <= b <= 122:
+            mask |= 1 << (b - 97)
+    return mask
+
+
+@dataclass
+class Candidates:
+    """Surviving dictionary rows of a WordIndex.
+
+    freq_totals and coverage_totals hold the per-letter sums of the counts
+    and presence matrices over alive. They are filled in on first use and
+    then carried through each filter step.
+    """
+
+    alive: np.ndarray
+    freq_totals: Optional[np.ndarray] = None
+    coverage_totals: Optional[np.ndarray] = None
+
+
+def _update_totals(
+    totals: Optional[np.ndarray],
+    matrix: np.ndarray,
+    alive: np.ndarray,
+    removed: np.ndarray,
+) -> Optional[np.ndarray]:
+    if totals is None:
+        return None
+    # Work from whichever side of the split is smaller
+    if len(removed) < len(alive):
+        return totals - sum_rows(matrix, removed, 0)
+    return sum_rows(matrix, alive, 0)
+
+
 def filter_candidates(
-    board: str, wrong_guesses: List[str], dictionary: List[str]
-) -> List[str]:
-    # Build regex from board: '.' means any letter
-    pattern = re.compile("^" + re.escape(board).replace("\\.", ".") + "$")
-    wrong_set = set(wrong_guesses)
-    return [w for w in dictionary if pattern.fullmatch(w) and not (set(w) & wrong_set)]
+    index: WordIndex, candidates: Candidates, guess: str, positions: int
+) -> Candidates:
+    """Keep the candidates consistent with the latest guess.
+
+    positions is the bitmask of board positions revealed by guess (0 for a
+    wrong guess). Filtering is monotonic, so earlier guesses are already
+    reflected in candidates and only the newest constraint needs checking:
+    a wrong letter must be absent, and a revealed letter must occupy its
+    revealed positions ('.' elsewhere still means any letter).
+    """
+    pm = index.pos_masks[ord(guess) - 97][candidates.alive]
+    if positions == 0:
+        keep = pm == 0
+    else:
+        keep = (pm & positions) == positions
+    alive = candidates.alive[keep]
+    removed = candidates.alive[~keep]
+    return Candidates(
+        alive=alive,
+        freq_totals=_update_totals(
+            candidates.freq_totals, index.counts, alive, removed
+        ),
+        coverage_totals=_update_totals(
+            candidates.coverage_totals, index.presence, alive, removed
+        ),
+    )
+
+
+def _pick_max(totals: np.ndarray, excluded: int) -> Optional[str]:
+    # argmax returns the first maximum, so ties break alphabetically;
+    # excluded letters score 0 and are never picked
+    scores = np.where((excluded >> LETTER_BITS) & 1 == 1, 0, totals)
+    c = int(scores.argmax())
+    return ALPHABET[c] if scores[c] > 0 else None
 
 
 def best_move_freq_raw(
-    board: str, wrong_guesses: List[str], dictionary: List[str]
+    board: bytearray, wrong_guesses: List[str], index: WordIndex, candidates: Candidates
 ) -> Optional[str]:
-    letters_already_found = {c for c in board if c != "."}
-    excluded = letters_already_found.union(wrong_guesses)
-    counts: Dict[str, int] = {c: 0 for c in ALPHABET if c not in excluded}
-    if not counts:
-        return None
-    for word in dictionary:
-        for ch in word:
-            if ch in counts:
-                counts[ch] += 1
-    max_count = max(counts.values(), default=0)
-    if max_count <= 0:
-        return None
-    # Argmax with alphabetical tie-break
-    return min([ch for ch, cnt in counts.items() if cnt == max_count])
+    excluded = board_mask(board) | letters_mask(wrong_guesses)
+    if candidates.freq_totals is None:
+        candidates.freq_totals = score_freq_raw(index.counts, candidates.alive, 0)
+    return _pick_max(candidates.freq_totals, excluded)
 
 
 def best_move_coverage(
-    board: str, wrong_guesses: List[str], dictionary: List[str]
+    board: bytearray, wrong_guesses: List[str], index: WordIndex, candidates: Candidates
 ) -> Optional[str]:
-    letters_already_found = {c for c in board if c != "."}
-    excluded = letters_already_found.union(wrong_guesses)
-    counts: Dict[str, int] = {c: 0 for c in ALPHABET if c not in excluded}
-    if not counts:
-        return None
-    for word in dictionary:
-        s = set(word)
-        for ch in s:
-            if ch in counts:
-                counts[ch] += 1
-    max_count = max(counts.values(), default=0)
-    if max_count <= 0:
-        return None
-    # Argmax with alphabetical tie-break
-    return min([ch for ch, cnt in counts.items() if cnt == max_count])
+    excluded = board_mask(board) | letters_mask(wrong_guesses)
+    if candidates.coverage_totals is None:
+        candidates.coverage_totals = score_coverage(index.presence, candidates.alive, 0)
+    return _pick_max(candidates.coverage_totals, excluded)
 
 
 def best_move_info_gain(
-    board: str, wrong_guesses: List[str], dictionary: List[str]
+    board: bytearray, wrong_guesses: List[str], index: WordIndex, candidates: Candidates
 ) -> Optional[str]:
     """Choose the letter that minimizes expected remaining candidate size.
 
     For each letter l not yet used, partition the dictionary by the mask of
-    positions where l appears in a word (empty tuple means a miss). The
+    positions where l appears in a word (0 means a miss). The
     expected remaining size after guessing l is:
         E[|S|] = sum_m p(m) * |S_m| = sum_m (|S_m|/N) * |S_m| = (1/N) * sum_m |S_m|^2
     We choose the letter minimizing sum_m |S_m|^2 (N is constant per letter).
     Ties break alphabetically.
     """
-    letters_already_found = {c for c in board if c != "."}
-    excluded = letters_already_found.union(wrong_guesses)
-    candidates = [c for c in ALPHABET if c not in excluded]
+    excluded = board_mask(board) | letters_mask(wrong_guesses)
+    scores = score_info_gain(index.pos_masks, candidates.alive, excluded, index.length)
+    candidates = [c for c in range(len(ALPHABET)) if not excluded >> c & 1]
     if not candidates:
         return None
-
-    # Precompute masks per word for speed? Compute per letter to keep memory small.
-    best_letter: Optional[str] = None
-    best_score: Optional[int] = None
-
-    for letter in candidates:
-        # Partition counts by mask (tuple of indices where the letter occurs)
-        part_counts: dict[tuple[int, ...], int] = {}
-        for w in dictionary:
-            mask_list = [i for i, ch in enumerate(w) if ch == letter]
-            mask = tuple(mask_list)  # empty tuple means miss
-            part_counts[mask] = part_counts.get(mask, 0) + 1
-
-        # Score = sum(count^2) (proportional to expected remaining size)
-        score = 0
-        for cnt in part_counts.values():
-            score += cnt * cnt
-
-        if (
-            best_score is None
-            or score < best_score
-            or (score == best_score and letter < (best_letter or "z"))
-        ):
-            best_score = score
-            best_letter = letter
-
-    return best_letter
+    # min keeps the alphabetically first letter on ties
+    return ALPHABET[min(candidates, key=scores.__getitem__)]
 
 
 def make_move(
-    target_word: str, board_list: List[str], guess: str, wrong_guesses: List[str]
-) -> Tuple[str, List[str]]:
-    correct = False
-    for i, ch in enumerate(target_word):
-        if ch == guess:
-            board_list[i] = guess
-            correct = True
-    if not correct:
+    target: bytes, board: bytearray, guess: str, wrong_guesses: List[str]
+) -> int:
+    """Apply guess in place to board and wrong_guesses.
+
+    Returns the bitmask of positions the guess revealed (0 if it was wrong).
+    """
+    g = ord(guess)
+    positions = 0
+    for i, c in enumerate(target):
+        if c == g:
+            board[i] = c
+            positions |= 1 << i
+    if not positions:
         wrong_guesses.append(guess)
-    return ("".join(board_list), wrong_guesses)
+    return positions
 
 
-def solve_with_strategy(
-    target_word: str, dictionary_all: List[str], chooser
-) -> SolverResult:
-    board = "." * len(target_word)
+def solve_with_strategy(target_word: str, index: WordIndex, chooser) -> SolverResult:
+    """Play target_word against the same-length dictionary in index."""
+    # Same single-byte encoding as the index, so positions line up. Characters
+    # outside a-z can never be guessed; such words play until letters run out.
+    target = target_word.encode("latin-1", "replace")
+    board = bytearray(b"." * len(target))
     wrong_guesses: List[str] = []
     total_guesses = 0
-    dictionary = [w for w in dictionary_all if len(w) == len(target_word)]
+    candidates = Candidates(alive=np.arange(len(index.words)))
+
+    guess = ""
+    positions = 0
 
-    while board != target_word:
+    while board != target:
         if total_guesses != 0:
-            dictionary = filter_candidates(board, wrong_guesses, dictionary)
-        guess = chooser(board, wrong_guesses, dictionary)
+            candidates = filter_candidates(index, candidates, guess, positions)
+            guess = chooser(board, wrong_guesses, index, candidates)
+        else:
+            if chooser not in index.first_guesses:
+                index.first_guesses[chooser] = chooser(
+                    board, wrong_guesses, index, candidates
+                )
+            guess = index.first_guesses[chooser]
         if guess is None:
-            # Fallback: first remaining letter
-            used = set(wrong_guesses) | {c for c in board if c != "."}
-            remaining = [c for c in ALPHABET if c not in used]
-            if not remaining:
+            # Fallback: first remaining letter (lowest unused bit)
+            unused = ALL_LETTERS & ~(board_mask(board) | letters_mask(wrong_guesses))
+            if not unused:
                 break
-            guess = remaining[0]
-        board_list = list(board)
-        board, wrong_guesses = make_move(target_word, board_list, guess, wrong_guesses)
+            guess = ALPHABET[(unused & -unused).bit_length() - 1]
+        positions = make_move(target, board, guess, wrong_guesses)
         total_guesses += 1
 
     return SolverResult(wrong_guesses=len(wrong_guesses), total_guesses=total_guesses)
 
 
+# -log of the probability floor, used for letters never seen at a length
+NEGLOG_FLOOR = -math.log(1e-9)
+
+
 def precompute_letter_incidence(
-    length_words: Dict[int, List[str]],
-) -> Dict[int, Dict[str, float]]:
-    out: Dict[int, Dict[str, float]] = {}
-    for L, words in length_words.items():
-        denom = max(1, len(words))
-        counts = {c: 0 for c in ALPHABET}
-        for w in words:
-            s = set(w)
-            for c in s:
-                if c in counts:
-                    counts[c] += 1
-        out[L] = {c: counts[c] / denom for c in ALPHABET}
+    length_buckets: Dict[int, WordIndex],
+) -> Dict[int, np.ndarray]:
+    """Per length, -log(p) for each letter, where p is the fraction of
+    same-length words containing it (floored at 1e-9)."""
+    out: Dict[int, np.ndarray] = {}
+    for L, index in length_buckets.items():
+        denom = max(1, len(index.words))
+        incidence = index.presence.sum(axis=0)
+        out[L] = -np.log(np.maximum(incidence / denom, 1e-9))
     return out
 
 
 def structural_scores(
-    word: str, p_by_len: Dict[int, Dict[str, float]]
+    word: str, neglog_by_len: Dict[int, np.ndarray]
 ) -> Tuple[float, float, float]:
     L = len(word)
-    uniq = set(word)
-    pmap = p_by_len.get(L, {})
-    rare = 0.0
-    for c in uniq:
-        p = pmap.get(c, 1e-9)
-        p = max(p, 1e-9)
-        rare += -math.log(p)
-    dup_factor = L / max(1, len(uniq))
+    neglog = neglog_by_len.get(L)
+    uniq_bits = letters_mask(word)
+    n_uniq = len(set(word))
+    # Characters outside a-z (apostrophes, hyphens, accents) get the floor
+    rare = (n_uniq - uniq_bits.bit_count()) * NEGLOG_FLOOR
+    while uniq_bits:
+        b = uniq_bits & -uniq_bits
+        rare += (
+            float(neglog[b.bit_length() - 1]) if neglog is not None else NEGLOG_FLOOR
+        )
+        uniq_bits ^= b
+    dup_factor = L / max(1, n_uniq)
     structural = rare / dup_factor
     return rare, dup_factor, structural
 
 
+def measure_word(
+    w: str, length_buckets: Dict[int, WordIndex], neglog_by_len: Dict[int, np.ndarray]
+) -> List[str]:
+    """Compute the report row for one dataset word."""
+    L = len(w)
+    # Skip words not present in dictionary length index; still compute structural using length bin
+    bucket = length_buckets.get(L)
+    # Solvers
+    wrong_freq_raw = None
+    wrong_coverage = None
+    wrong_info_gain = None
+    if bucket is not None:
+        res_freq = solve_with_strategy(w, bucket, best_move_freq_raw)
+        res_cov = solve_with_strategy(w, bucket, best_move_coverage)
+        res_inf = solve_with_strategy(w, bucket, best_move_info_gain)
+        wrong_freq_raw = res_freq.wrong_guesses
+        wrong_coverage = res_cov.wrong_guesses
+        wrong_info_gain = res_inf.wrong_guesses
+    # Structural
+    rare, dup, structural = structural_scores(w, neglog_by_len)
+    return [
+        w,
+        str(L),
+        str(wrong_freq_raw) if wrong_freq_raw is not None else "",
+        str(wrong_coverage) if wrong_coverage is not None else "",
+        str(wrong_info_gain) if wrong_info_gain is not None else "",
+        f"{rare:.3f}",
+        f"{dup:.3f}",
+        f"{structural:.3f}",
+    ]
+
+
+# Read-only state shared by the words measured in a worker process
+_worker_state: Tuple[Dict[int, WordIndex], Dict[int, np.ndarray]] = ({}, {})
+
+
+def _init_worker(
+    length_buckets: Dict[int, WordIndex], neglog_by_len: Dict[int, np.ndarray]
+) -> None:
+    # Runs once per worker, so the indexes are pickled once rather than per word
+    global _worker_state
+    _worker_state = (length_buckets, neglog_by_len)
+
+
+def _measure_in_worker(w: str) -> List[str]:
+    return measure_word(w, *_worker_state)
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="Objective difficulty metrics for Hangman words"
@@ -259,6 +417,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         default=str(REPO_ROOT / "analysis/difficulty_report.tsv"),
         help="Path to output TSV",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for the per-word solves (1 runs in-process)",
+    )
     args = parser.parse_args(argv)
 
     datasets_path = pathlib.Path(args.datasets)
@@ -267,61 +431,43 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     dataset_words = load_dataset_words(datasets_path)
     dictionary_all = load_wordlist(dict_path)
+    # Index each length bucket the dataset needs once; all three solvers share it
     length_index = build_length_index(dictionary_all)
-    p_letter_len = precompute_letter_incidence(length_index)
+    length_buckets = {
+        L: build_word_index(length_index[L], L)
+        for L in sorted({len(w) for w in dataset_words})
+        if L in length_index and L <= MAX_WORD_LENGTH
+    }
+    neglog_by_len = precompute_letter_incidence(length_buckets)
 
     # Compute metrics per word
-    rows: List[List[str]] = []
-    for w in dataset_words:
-        L = len(w)
-        # Skip words not present in dictionary length index; still compute structural using length bin
-        dict_L = length_index.get(L, [])
-        # Solvers
-        wrong_freq_raw = None
-        wrong_coverage = None
-        wrong_info_gain = None
-        if dict_L:
-            res_freq = solve_with_strategy(w, dict_L, best_move_freq_raw)
-            res_cov = solve_with_strategy(w, dict_L, best_move_coverage)
-            res_inf = solve_with_strategy(w, dict_L, best_move_info_gain)
-            wrong_freq_raw = res_freq.wrong_guesses
-            wrong_coverage = res_cov.wrong_guesses
-            wrong_info_gain = res_inf.wrong_guesses
-        # Structural
-        rare, dup, structural = structural_scores(w, p_letter_len)
-        rows.append(
-            [
-                w,
-                str(L),
-                str(wrong_freq_raw) if wrong_freq_raw is not None else "",
-                str(wrong_coverage) if wrong_coverage is not None else "",
-                str(wrong_info_gain) if wrong_info_gain is not None else "",
-                f"{rare:.3f}",
-                f"{dup:.3f}",
-                f"{structural:.3f}",
-            ]
-        )
-
-    # Write TSV
+    if args.workers <= 1:
+        rows = [measure_word(w, length_buckets, neglog_by_len) for w in dataset_words]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(length_buckets, neglog_by_len),
+        ) as pool:
+            chunksize = max(1, len(dataset_words) // (4 * args.workers))
+            rows = list(
+                pool.map(_measure_in_worker, dataset_words, chunksize=chunksize)
+            )
+
+    # Write TSV; fields are plain words and numbers, so no csv quoting is needed
+    header = [
+        "word",
+        "length",
+        "wrong_freq_raw",
+        "wrong_coverage",
+        "wrong_info_gain",
+        "rare_score",
+        "dup_factor",
+        "structural_score",
+    ]
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8", newline="") as f:
-        import csv
-
-        writer = csv.writer(f, delimiter="\t")
-        writer.writerow(
-            [
-                "word",
-                "length",
-                "wrong_freq_raw",
-                "wrong_coverage",
-                "wrong_info_gain",
-                "rare_score",
-                "dup_factor",
-                "structural_score",
-            ]
-        )
-        for r in rows:
-            writer.writerow(r)
+    with out_path.open("w", encoding="utf-8", buffering=1 << 20, newline="") as f:
+        f.write("\n".join("\t".join(r) for r in [header, *rows]) + "\n")
 
     print(f"Wrote {len(rows)} rows to {out_path}")
     print(
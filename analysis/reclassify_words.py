@@ -26,9 +26,12 @@ Outputs:
 from __future__ import annotations
 
 import argparse
+import bisect
 import csv
+import itertools
 import math
 import pathlib
+import statistics
 import sys
 import importlib.util
 from dataclasses import dataclass
@@ -107,31 +110,18 @@ def compute_quantile_thresholds(values: Sequence[float], bins: int = 5) -> List[
     """Compute (bins-1) quantile thresholds for the provided values.
 
     Returns a sorted list of length (bins-1) containing interior thresholds.
-    Uses a simple linear interpolation percentile approach to avoid numpy dependency.
+    Uses statistics.quantiles with the inclusive method, i.e. linear
+    interpolation between closest ranks.
     """
     if bins < 2:
         raise ValueError("bins must be >= 2")
     if not values:
         raise ValueError("No values provided to compute thresholds")
+    if len(values) == 1:
+        # statistics.quantiles needs at least two data points
+        return [float(values[0])] * (bins - 1)
 
-    sorted_vals = sorted(values)
-
-    def percentile(p: float) -> float:
-        # p in [0, 100]
-        if p <= 0:
-            return sorted_vals[0]
-        if p >= 100:
-            return sorted_vals[-1]
-        rank = (p / 100) * (len(sorted_vals) - 1)
-        lo = int(math.floor(rank))
-        hi = int(math.ceil(rank))
-        if lo == hi:
-            return sorted_vals[lo]
-        frac = rank - lo
-        return sorted_vals[lo] * (1 - frac) + sorted_vals[hi] * frac
-
-    step = 100.0 / bins
-    thresholds = [percentile(step * k) for k in range(1, bins)]
+    thresholds = statistics.quantiles(values, n=bins, method="inclusive")
     # Ensure monotonic non-decreasing thresholds
     for i in range(1, len(thresholds)):
         if thresholds[i] < thresholds[i - 1]:
@@ -149,8 +139,6 @@ def classify_by_thresholds(value: float, thresholds: Sequence[float], labels: Se
       ...
       value > t_{k-1}       -> labels[k]
     """
-    import bisect
-
     # Use bisect_left so equality goes to the lower bin, matching the
     # documented mapping above.
     idx = bisect.bisect_left(thresholds, value)
@@ -236,12 +224,21 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     else:
         thresholds = compute_quantile_thresholds(list(present_means.values()), bins=args.bins)
 
-    # Build results
+    # Build results in alphabetical order, dispatching each word into its bin
+    # as it is classified so every bin comes out already sorted for the snippet
+    order_index = {label: i for i, label in enumerate(DIFFICULTY_ORDER)}
+    buckets: List[List[ReclassResult]] = [[] for _ in DIFFICULTY_ORDER]
     results: List[ReclassResult] = []
     for w, m in sorted(present_means.items()):
-        new_diff = classify_by_thresholds(m, thresholds, DIFFICULTY_ORDER)
-        old_diff = current_words.get(w)
-        results.append(ReclassResult(word=w, mean_wrong_guesses=m, old_difficulty=old_diff, new_difficulty=new_diff))
+        new_difficulty = classify_by_thresholds(m, thresholds, DIFFICULTY_ORDER)
+        result = ReclassResult(
+            word=w,
+            mean_wrong_guesses=m,
+            old_difficulty=current_words.get(w),
+            new_difficulty=new_difficulty,
+        )
+        results.append(result)
+        buckets[order_index[new_difficulty]].append(result)
 
     # Write report TSV
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -271,14 +268,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if args.emit_snippet:
         snippet_path = pathlib.Path(args.emit_snippet)
         snippet_path.parent.mkdir(parents=True, exist_ok=True)
-        # Sort by new difficulty order then alphabetically
-        order_index = {d: i for i, d in enumerate(DIFFICULTY_ORDER)}
-        sorted_entries = sorted(results, key=lambda r: (order_index[r.new_difficulty], r.word))
+        # Ordered by new difficulty, then alphabetically
         with snippet_path.open("w", encoding="utf-8") as sf:
             sf.write("# Auto-generated by scripts/reclassify_words.py\n")
             sf.write("from hangman_bench.datasets import WordEntry\n\n")
             sf.write("ENGLISH_WORDS_RECLASSIFIED = [\n")
-            for r in sorted_entries:
+            for r in itertools.chain.from_iterable(buckets):
                 sf.write(f"    WordEntry(\"{r.word}\", \"{r.new_difficulty}\"),\n")
             sf.write("]\n")
         print(f"  Snippet written to: {snippet_path}")
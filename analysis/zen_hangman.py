@@ -29,11 +29,15 @@ This script uses only the Python standard library.
 """
 
 import argparse
-import re
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, List
 
 ALPHABET = [chr(c) for c in range(ord("a"), ord("z") + 1)]
+ALL_LETTERS = (1 << len(ALPHABET)) - 1
+
+# Per-letter counts reused by every best_move_for call
+_scratch = array("i", [0] * 26)
 
 
 @dataclass
@@ -45,57 +49,82 @@ class GameResult:
 
 def load_words(path: str, num_letters: int) -> List[str]:
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        tokens = f.read().split()
-    words: List[str] = []
-    for token in tokens:
-        w = token.strip().lower()
-        if len(w) == num_letters and re.fullmatch(r"[a-z]+", w):
-            words.append(w)
-    # Deduplicate while preserving order
-    seen = set()
-    unique_words: List[str] = []
-    for w in words:
-        if w not in seen:
-            seen.add(w)
-            unique_words.append(w)
-    return unique_words
+        tokens = f.read().lower().split()
+    # Tokens are already lowercase, so ASCII alphabetic means [a-z]+;
+    # dict.fromkeys deduplicates while preserving order
+    return list(
+        dict.fromkeys(
+            w for w in tokens if len(w) == num_letters and w.isascii() and w.isalpha()
+        )
+    )
+
+
+def letters_mask(letters: List[str]) -> int:
+    """Bitmask of the letters given (bit 0 = 'a')."""
+    mask = 0
+    for ch in letters:
+        mask |= 1 << (ord(ch) - 97)
+    return mask
+
+
+def board_mask(board: bytes) -> int:
+    """Bitmask of the letters revealed on board, ignoring b'.'."""
+    mask = 0
+    for b in board:
+        if b != 46:
+            mask |= 1 << (b - 97)
+    return mask
 
 
 def best_move_for(
-    board: str, wrong_guesses: List[str], dictionary: List[str]
+    board: bytes, wrong_guesses: List[str], dictionary: List[str]
 ) -> str | None:
-    letters_already_found = {c for c in board if c != "."}
-    excluded = letters_already_found.union(wrong_guesses)
-    counts = {c: 0 for c in ALPHABET if c not in excluded}
+    excluded = board_mask(board) | letters_mask(wrong_guesses)
+
+    # Count every remaining letter over the whole candidate list at once
+    counts = _scratch
+    blob = "".join(dictionary)
+    for i, ch in enumerate(ALPHABET):
+        counts[i] = 0 if excluded >> i & 1 else blob.count(ch)
+
+    # Pick the letter with the greatest count; strictly greater keeps the
+    # alphabetically first letter on ties
+    best_count = 0
+    best_i = -1
+    for i in range(26):
+        if counts[i] > best_count:
+            best_count = counts[i]
+            best_i = i
+    return ALPHABET[best_i] if best_i >= 0 else None
 
-    if not counts:
-        return None
 
-    for word in dictionary:
-        for ch in word:
-            if ch in counts:
-                counts[ch] += 1
+def board_matcher(board: str) -> Callable[[str], bool]:
+    """Return a predicate for words matching board, where '.' matches any letter.
 
-    # Pick the letter with the greatest count; break ties alphabetically
-    # by selecting the smallest letter among those with max count.
-    max_count = max(counts.values(), default=0)
-    if max_count <= 0:
-        return None
-    candidates = [ch for ch, cnt in counts.items() if cnt == max_count]
-    return min(candidates) if candidates else None
+    Equivalent to the regex ^board$ with '.' as a wildcard, for boards of
+    lowercase letters and '.' (words are already filtered to the board length).
+    """
+    fixed = [(i, c) for i, c in enumerate(board) if c != "."]
+
+    def matches(w: str) -> bool:
+        return all(w[i] == c for i, c in fixed)
+
+    return matches
 
 
 def make_move(
-    target_word: str, board: List[str], guess: str, wrong_guesses: List[str]
-) -> Tuple[str, List[str]]:
+    target: bytes, board: bytearray, guess: str, wrong_guesses: List[str]
+) -> bool:
+    """Apply guess in place to board and wrong_guesses; return whether it was correct."""
+    g = ord(guess)
     correct = False
-    for i, ch in enumerate(target_word):
-        if ch == guess:
-            board[i] = guess
+    for i, c in enumerate(target):
+        if c == g:
+            board[i] = c
             correct = True
     if not correct:
         wrong_guesses.append(guess)
-    return ("".join(board), wrong_guesses)
+    return correct
 
 
 def result_for(
@@ -104,40 +133,45 @@ def result_for(
     wrong_guesses: List[str] = []
     num_guesses = 0
     dictionary = list(dictionary_all)  # clone per original ruby behavior
+    # Board state is a mutable byte buffer, compared directly with the target
+    target = target_word.encode("ascii")
+    board_state = bytearray(board.encode("ascii"))
 
-    while board != target_word:
+    guess = ""
+    correct = False
+    while board_state != target:
         # After first guess, filter by board and wrong guesses, like the ruby (which only
-        # filters by board). We also prune by wrong guesses.
+        # filters by board). We also prune by wrong guesses. Candidates only ever
+        # shrink, so only the latest guess needs checking.
         if num_guesses != 0:
-            # Build regex from board where '.' matches any letter
-            # e.g., board 'c.t..' => r'^c.t..$'
-            pattern = re.compile("^" + re.escape(board).replace("\.", ".") + "$")
-            wrong_set = set(wrong_guesses)
-            dictionary = [
-                w
-                for w in dictionary
-                if pattern.fullmatch(w) and not (set(w) & wrong_set)
-            ]
+            if not correct:
+                dictionary = [w for w in dictionary if guess not in w]
+            else:
+                # Positions just revealed must hold the guess; '.' matches any letter
+                revealed = "".join(c if c == guess else "." for c in target_word)
+                matches = board_matcher(revealed)
+                dictionary = [w for w in dictionary if matches(w)]
 
         if debug:
             print(" > Considering my best move...")
 
-        guess = best_move_for(board, wrong_guesses, dictionary)
+        guess = best_move_for(board_state, wrong_guesses, dictionary)
         if guess is None:
             # Fallback: pick first remaining alphabet letter not already used
-            used = set(wrong_guesses) | {c for c in board if c != "."}
-            remaining = [c for c in ALPHABET if c not in used]
-            if not remaining:
+            unused = ALL_LETTERS & ~(
+                board_mask(board_state) | letters_mask(wrong_guesses)
+            )
+            if not unused:
                 # No moves possible; break to avoid infinite loop
                 break
-            guess = remaining[0]
+            # Lowest set bit is the alphabetically first unused letter
+            guess = ALPHABET[(unused & -unused).bit_length() - 1]
 
         if debug:
             print(f" > I guess '{guess}'")
 
         # Apply guess
-        board_list = list(board)
-        board, wrong_guesses = make_move(target_word, board_list, guess, wrong_guesses)
+        correct = make_move(target, board_state, guess, wrong_guesses)
         num_guesses += 1
 
     return GameResult(
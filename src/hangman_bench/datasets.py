@@ -12,7 +12,7 @@ Difficulty is rated on a scale from 1-5:
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Literal
+from typing import Literal, get_args
 
 
 class Language(str, Enum):
@@ -26,18 +26,24 @@ class Language(str, Enum):
 
 
 Difficulty = Literal["v_easy", "easy", "medium", "hard", "v_hard"]
+DIFFICULTIES: tuple[Difficulty, ...] = get_args(Difficulty)
+_DIFFICULTY_SET: frozenset[Difficulty] = frozenset(DIFFICULTIES)
+_DIFFICULTY_ERROR = f"Difficulty must be one of: {', '.join(DIFFICULTIES)}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WordEntry:
-    """A word entry in the hangman dataset."""
+    """A word entry in the hangman dataset.
+
+    Immutable, so the module-level word tuples can be shared safely.
+    """
 
     word: str
     difficulty: Difficulty
 
 
 # English word dataset with difficulty ratings for hangman
-ENGLISH_WORDS = [
+ENGLISH_WORDS = (
     # Difficulty v_easy (Very Easy)
     WordEntry("apple", "v_easy"),
     WordEntry("happy", "v_easy"),
@@ -143,36 +149,46 @@ ENGLISH_WORDS = [
     WordEntry("topaz", "v_hard"),
     WordEntry("vortex", "v_hard"),
     WordEntry("zodiac", "v_hard"),
-]
+)
 
 # Map of language to word list
 LANGUAGE_WORDS = {
     Language.ENGLISH: ENGLISH_WORDS,
 }
+_SUPPORTED_LANGUAGES = ", ".join(lang.value for lang in LANGUAGE_WORDS)
+
+# Words per language and difficulty, partitioned once at import
+_WORDS_BY_DIFFICULTY: dict[Language, dict[Difficulty, tuple[WordEntry, ...]]] = {
+    language: {
+        difficulty: tuple(word for word in words if word.difficulty == difficulty)
+        for difficulty in DIFFICULTIES
+    }
+    for language, words in LANGUAGE_WORDS.items()
+}
 
 
-def get_words_by_language(language: Language) -> List[WordEntry]:
+def get_words_by_language(language: Language) -> tuple[WordEntry, ...]:
     """Get the word dataset for a specific language.
 
     Args:
         language: The language to get words for
 
     Returns:
-        List of WordEntry objects for the specified language
+        Read-only tuple of WordEntry objects for the specified language
 
     Raises:
         ValueError: If the language is not supported
     """
     if language not in LANGUAGE_WORDS:
         raise ValueError(
-            f"Unsupported language: {language}. Supported languages: {', '.join([lang.value for lang in LANGUAGE_WORDS.keys()])}"
+            f"Unsupported language: {language}. Supported languages: {_SUPPORTED_LANGUAGES}"
         )
-    return LANGUAGE_WORDS[language].copy()
+    return LANGUAGE_WORDS[language]
 
 
 def get_words_by_difficulty(
     language: Language, difficulty: Difficulty
-) -> List[WordEntry]:
+) -> tuple[WordEntry, ...]:
     """Get words of a specific difficulty level for a language.
 
     Args:
@@ -180,12 +196,11 @@ def get_words_by_difficulty(
         difficulty: Difficulty level label (v_easy, easy, medium, hard, v_hard)
 
     Returns:
-        List of WordEntry objects matching the criteria
+        Read-only tuple of WordEntry objects matching the criteria
     """
-    allowed: tuple[Difficulty, ...] = ("v_easy", "easy", "medium", "hard", "v_hard")
-    if difficulty not in allowed:
-        allowed_str = ", ".join(allowed)
-        raise ValueError(f"Difficulty must be one of: {allowed_str}")
+    if difficulty not in _DIFFICULTY_SET:
+        raise ValueError(_DIFFICULTY_ERROR)
 
-    words = get_words_by_language(language)
-    return [word for word in words if word.difficulty == difficulty]
+    # Validates the language
+    get_words_by_language(language)
+    return _WORDS_BY_DIFFICULTY[language][difficulty]
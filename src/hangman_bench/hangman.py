@@ -1,4 +1,6 @@
+import string
 from dataclasses import dataclass
+from functools import cache
 from typing import Any, List
 
 from inspect_ai import Task, task
@@ -22,7 +24,7 @@ from inspect_ai.solver import (
 )
 from inspect_ai.agent import react, as_solver, AgentSubmit, AgentState
 from inspect_ai.tool import Tool, tool
-from inspect_ai.util import StoreModel, store_as
+from inspect_ai.util import StoreModel, store, store_as
 from pydantic import Field
 
 from hangman_bench.datasets import (
@@ -35,6 +37,41 @@ from hangman_bench.datasets import (
 DEFAULT_MAX_GUESSES = 10
 DEFAULT_LANGUAGE = Language.ENGLISH
 NUM_ALLOWABLE_EXTRA_MESSAGES = 5  # Extra messages beyond word length + max guesses
+_LANGUAGE_NAMES = ", ".join(lang.value for lang in Language)
+
+SYSTEM_MESSAGE = """
+    You are playing a game of Hangman. Try to guess the word one letter at a time.
+    The current state shows '_' for unguessed letters and reveals correctly guessed letters.
+    You have limited guesses before losing. Make smart guesses based on common letter frequencies
+    and word patterns in the specified language, and the result of previous guesses.
+
+    Guess one letter at a time using the hangman_guess tool like `hangman_guess("a")`.
+    The tool will return:
+    - current_state: The word with guessed letters revealed and unguessed letters as '_'
+    - remaining_guesses: Number of guesses remaining
+    - incorrect_guesses: List of incorrect letters guessed
+    - game_over: Whether the game has ended
+    - won: Whether the player won (only valid if game_over is True)
+    - language: The language of the current word
+
+    Adapt your strategy based on the language.
+    """
+SYSTEM_MESSAGE_WITHOUT_WORD_GUESSES = (
+    SYSTEM_MESSAGE
+    + """
+    You must guess all the letters in the word to win the game.
+    You can ONLY win by guessing all the letters in the word, one at a time.
+    The game will end automatically when it is over.
+    """
+)
+SYSTEM_MESSAGE_WITH_WORD_GUESSES = (
+    SYSTEM_MESSAGE
+    + """
+    You can also guess the entire word at any point before running out of guesses,
+    by submitting the word as a single string using `submit("word")`. This will end the game.
+    The game will end automatically when it is over.
+    """
+)
 
 
 @task
@@ -60,9 +97,8 @@ def hangman(
     try:
         lang_enum = Language(language.lower())
     except ValueError:
-        supported = ", ".join([lang.value for lang in Language])
         raise ValueError(
-            f"Language '{language}' not supported. Supported languages: {supported}"
+            f"Language '{language}' not supported. Supported languages: {_LANGUAGE_NAMES}"
         )
 
     # Get words based on language and optional difficulty
@@ -73,29 +109,24 @@ def hangman(
 
     longest_word_length = max(len(entry.word) for entry in word_entries)
 
-    # Create samples
-    samples = []
-    for entry in word_entries:
-        samples.append(
-            Sample(
-                id=entry.word,
-                input=(
-                    f"You are playing a game of Hangman in {lang_enum.value}. "
-                    f"Try to guess the word one letter at a time. "
-                    f"The current state shows '_' for unguessed letters and reveals correctly guessed letters. "
-                    f"You lose the game after {max_guesses} incorrect guesses. "
-                    f"Make smart guesses based on common letter frequencies and word patterns in {lang_enum.value}."
-                ),
-                target=[entry.word],
-                metadata={
-                    "word": entry.word,
-                    "max_guesses": max_guesses,
-                    "difficulty": entry.difficulty,
-                    "language": lang_enum.value,
-                    "allow_word_guesses": allow_word_guesses,
-                },
-            )
+    # Create samples; every sample shares the same prompt string
+    language_value = lang_enum.value
+    prompt = _sample_prompt(language_value, max_guesses)
+    samples = [
+        Sample(
+            id=entry.word,
+            input=prompt,
+            target=entry.word,
+            metadata={
+                "word": entry.word,
+                "max_guesses": max_guesses,
+                "difficulty": entry.difficulty,
+                "language": language_value,
+                "allow_word_guesses": allow_word_guesses,
+            },
         )
+        for entry in word_entries
+    ]
 
     dataset = MemoryDataset(samples)
     if shuffle:
@@ -103,19 +134,59 @@ def hangman(
 
     return Task(
         dataset=dataset,
-        solver=hangman_player(allow_word_guesses=allow_word_guesses),
+        solver=hangman_player(
+            allow_word_guesses=allow_word_guesses, language=language_value
+        ),
         setup=game_initialiser(),
         scorer=game_scorer(),
         message_limit=_calculate_message_limit(longest_word_length, max_guesses),
     )
 
 
+@cache
+def _sample_prompt(language: str, max_guesses: int) -> str:
+    # Identical for every sample in a task
+    return (
+        f"You are playing a game of Hangman in {language}. "
+        f"Try to guess the word one letter at a time. "
+        f"The current state shows '_' for unguessed letters and reveals correctly guessed letters. "
+        f"You lose the game after {max_guesses} incorrect guesses. "
+        f"Make smart guesses based on common letter frequencies and word patterns in {language}."
+    )
+
+
+@cache
+def _initial_prompt(language: str, max_guesses: int, word_length: int) -> str:
+    # Shared by every sample with the same word length
+    return (
+        f"Let's play hangman in {language}! You have {max_guesses} guesses.\n"
+        f"The word is {' '.join('_' * word_length)}.\n"
+    )
+
+
+@cache
 def _calculate_message_limit(word_length: int, max_guesses: int) -> int:
     # Models sometimes respond with commentary, then need a "continue" message,
     # and then call the tool and get the tool response. So we allow 4 messages per guess.
     return (word_length + max_guesses) * 4 + NUM_ALLOWABLE_EXTRA_MESSAGES
 
 
+def _letter_bit(letter: str) -> int:
+    """Bit for a letter in a GameState mask (bit n is code point n)."""
+    return 1 << ord(letter)
+
+
+# Valid guesses in either case, mapped to their lowercase letter and bit
+_ASCII_GUESSES = {c: (c.lower(), _letter_bit(c.lower())) for c in string.ascii_letters}
+
+
+def _letters_mask(letters: str | list[str]) -> int:
+    mask = 0
+    for letter in letters:
+        mask |= _letter_bit(letter)
+    return mask
+
+
 @dataclass
 class GameState:
     word: str
@@ -124,6 +195,20 @@ class GameState:
     game_over: bool = False
     won: bool = False
 
+    def __post_init__(self) -> None:
+        # Letter bitmasks mirroring word and guessed_letters, for O(1) membership
+        # tests. Plain attributes rather than fields, so they are not serialized.
+        self.word_mask = _letters_mask(self.word)
+        self.guessed_mask = _letters_mask(self.guessed_letters)
+        # Board characters, updated in place as letters are revealed
+        self.letter_positions: dict[str, list[int]] = {}
+        for i, letter in enumerate(self.word):
+            self.letter_positions.setdefault(letter, []).append(i)
+        guessed = self.guessed_mask
+        self.display = [
+            letter if guessed & _letter_bit(letter) else "_" for letter in self.word
+        ]
+
     @staticmethod
     def start(word: str, max_guesses: int = DEFAULT_MAX_GUESSES) -> "GameState":
         return GameState(
@@ -135,34 +220,49 @@ class GameState:
     @property
     def current_state(self) -> str:
         """Returns the current state of the word with unguessed letters as '_'"""
-        return " ".join(
-            letter if letter in self.guessed_letters else "_" for letter in self.word
-        )
+        return " ".join(self.display)
 
     @property
     def incorrect_guesses(self) -> List[str]:
         """Returns list of incorrect guesses"""
-        return sorted(list(set(self.guessed_letters) - set(self.word)))
+        # Set bits are visited lowest first, i.e. in sorted letter order
+        wrong = self.guessed_mask & ~self.word_mask
+        letters = []
+        while wrong:
+            lowest = wrong & -wrong
+            letters.append(chr(lowest.bit_length() - 1))
+            wrong ^= lowest
+        return letters
 
     def guess(self, letter: str) -> "GameState":
         """Process a letter guess and return the new game state"""
         if self.game_over:
             return self
 
-        letter = letter.lower()
-        if len(letter) != 1 or not letter.isalpha():
-            raise ValueError("Guess must be a single letter")
+        known = _ASCII_GUESSES.get(letter)
+        if known is not None:
+            letter, bit = known
+        else:
+            # Anything else still gets the general check, so non-ASCII letters work
+            letter = letter.lower()
+            if len(letter) != 1 or not letter.isalpha():
+                raise ValueError("Guess must be a single letter")
+            bit = _letter_bit(letter)
 
-        if letter in self.guessed_letters:
+        if self.guessed_mask & bit:
             return self
 
         self.guessed_letters.append(letter)
+        self.guessed_mask |= bit
 
-        if letter not in self.word:
+        if self.word_mask & bit:
+            for i in self.letter_positions[letter]:
+                self.display[i] = letter
+        else:
             self.remaining_guesses -= 1
 
         # Check win condition
-        if all(letter in self.guessed_letters for letter in self.word):
+        if self.guessed_mask & self.word_mask == self.word_mask:
             self.game_over = True
             self.won = True
 
@@ -174,15 +274,45 @@ class GameState:
 
 
 class HangmanStore(StoreModel):
-    """Typed interface to the per-sample store."""
+    """Typed interface to the per-sample store.
+
+    The solver writes through this model; the tool and scorer read the
+    underlying store keys directly when they can (see _read_game).
+    """
 
     game_state: GameState | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+# Store keys HangmanStore currently uses for its fields, for reading them without
+# the model's per-access validation. A miss falls back to store_as, so a change
+# in how StoreModel names its keys only costs the fast path
+_GAME_STATE_KEY = f"{HangmanStore.__name__}:game_state"
+_METADATA_KEY = f"{HangmanStore.__name__}:metadata"
+
+
+def _read_game() -> tuple[GameState | None, dict[str, Any]]:
+    """Return the sample's game state and metadata, straight from the store
+    when they are already typed and via HangmanStore otherwise."""
+    sample_store = store()
+    game_state = sample_store.get(_GAME_STATE_KEY)
+    metadata = sample_store.get(_METADATA_KEY)
+    if isinstance(game_state, GameState) and isinstance(metadata, dict):
+        return game_state, metadata
+    hstore = store_as(HangmanStore)
+    return hstore.game_state, hstore.metadata or {}
+
+
 @tool(parallel=False)
-def hangman_guess() -> Tool:
-    """Tool for guessing letters in the hangman game"""
+def hangman_guess(language: str | None = None) -> Tool:
+    """Tool for guessing letters in the hangman game
+
+    Args:
+        language: Language of every game the tool is used for, or None to
+            read it from each sample's metadata
+    """
+    # A task plays all its games in one language, so the footer is usually fixed
+    language_line = None if language is None else f"Language: {language}"
 
     async def execute(letter: str) -> str:
         """Submit a letter guess for the current hangman game.
@@ -197,9 +327,7 @@ def hangman_guess() -> Tool:
             - Incorrect guesses made so far
             - Game status (ongoing, won, or lost)
         """
-        hstore = store_as(HangmanStore)
-        game_state = hstore.game_state
-        metadata = hstore.metadata or {}
+        game_state, metadata = _read_game()
 
         if game_state is None:
             raise RuntimeError(
@@ -210,10 +338,11 @@ def hangman_guess() -> Tool:
             game_state.guess(letter)  # Updates the game state
 
         # Format the result as a readable string
+        incorrect_guesses = game_state.incorrect_guesses
         result_lines = [
             f"Word: {game_state.current_state}",
             f"Remaining guesses: {game_state.remaining_guesses}",
-            f"Incorrect guesses: {', '.join(game_state.incorrect_guesses) if game_state.incorrect_guesses else 'none'}",
+            f"Incorrect guesses: {', '.join(incorrect_guesses) if incorrect_guesses else 'none'}",
         ]
 
         if game_state.game_over:
@@ -225,7 +354,8 @@ def hangman_guess() -> Tool:
             result_lines.append("Status: Game continues")
 
         result_lines.append(
-            f"Language: {metadata.get('language', DEFAULT_LANGUAGE.value)}"
+            language_line
+            or f"Language: {metadata.get('language', DEFAULT_LANGUAGE.value)}"
         )
 
         return "\n".join(result_lines)
@@ -234,51 +364,24 @@ def hangman_guess() -> Tool:
 
 
 @solver
-def hangman_player(allow_word_guesses: bool = False) -> Solver:
-    """Solver that uses the hangman_guess tool to play hangman"""
-    SYSTEM_MESSAGE = """
-    You are playing a game of Hangman. Try to guess the word one letter at a time.
-    The current state shows '_' for unguessed letters and reveals correctly guessed letters.
-    You have limited guesses before losing. Make smart guesses based on common letter frequencies
-    and word patterns in the specified language, and the result of previous guesses.
-
-    Guess one letter at a time using the hangman_guess tool like `hangman_guess("a")`.
-    The tool will return:
-    - current_state: The word with guessed letters revealed and unguessed letters as '_'
-    - remaining_guesses: Number of guesses remaining
-    - incorrect_guesses: List of incorrect letters guessed
-    - game_over: Whether the game has ended
-    - won: Whether the player won (only valid if game_over is True)
-    - language: The language of the current word
+def hangman_player(
+    allow_word_guesses: bool = False, language: str | None = None
+) -> Solver:
+    """Solver that uses the hangman_guess tool to play hangman
 
-    Adapt your strategy based on the language.
-    """
-    system_message_without_word_guesses = (
-        SYSTEM_MESSAGE
-        + """
-    You must guess all the letters in the word to win the game.
-    You can ONLY win by guessing all the letters in the word, one at a time.
-    The game will end automatically when it is over.
-    """
-    )
-    system_message_with_word_guesses = (
-        SYSTEM_MESSAGE
-        + """
-    You can also guess the entire word at any point before running out of guesses,
-    by submitting the word as a single string using `submit("word")`. This will end the game.
-    The game will end automatically when it is over.
+    Args:
+        allow_word_guesses: Whether the agent may submit a whole-word guess
+        language: Language of the games, passed through to hangman_guess
     """
-    )
     final_system_message = (
-        system_message_without_word_guesses
-        if not allow_word_guesses
-        else system_message_with_word_guesses
+        SYSTEM_MESSAGE_WITH_WORD_GUESSES
+        if allow_word_guesses
+        else SYSTEM_MESSAGE_WITHOUT_WORD_GUESSES
     )
 
     async def on_continue(state: AgentState) -> bool | str:
         # Stop automatically when game is over; otherwise, urge model to keep using tools
-        hstore = store_as(HangmanStore)
-        game_state = hstore.game_state
+        game_state, _ = _read_game()
         if game_state is None or game_state.game_over:
             return False
         # If the last response was a tool call, return True
@@ -292,7 +395,7 @@ def hangman_player(allow_word_guesses: bool = False) -> Solver:
     return as_solver(
         react(
             prompt=final_system_message,
-            tools=[hangman_guess()],
+            tools=[hangman_guess(language=language)],
             on_continue=on_continue,
             submit=AgentSubmit(answer_only=True) if allow_word_guesses else False,
         )
@@ -319,19 +422,16 @@ def game_initialiser() -> Solver:
             max_guesses=max_guesses,
         )
 
-        # Store game state and metadata using a typed store model
-        hstore = store_as(HangmanStore)
-        hstore.game_state = hangman_game
-        hstore.metadata = {
+        # Store game state and metadata
+        hangman_store = store_as(HangmanStore)
+        hangman_store.game_state = hangman_game
+        hangman_store.metadata = {
             "language": language,
             "difficulty": difficulty,
             "allow_word_guesses": allow_word_guesses,
         }
 
-        state.user_prompt.text = (
-            f"Let's play hangman in {language}! You have {max_guesses} guesses.\n"
-            f"The word is {' '.join(['_'] * len(word))}.\n"
-        )
+        state.user_prompt.text = _initial_prompt(language, max_guesses, len(word))
         return state
 
     return solve
@@ -347,15 +447,19 @@ def game_scorer() -> Scorer:
     """Score the hangman game based on whether the player won or not"""
 
     async def score(state: TaskState, target: Target) -> Score:
-        hstore = store_as(HangmanStore)
-        game_state = hstore.game_state
-        metadata: dict[str, Any] = hstore.metadata or {}
+        game_state, metadata = _read_game()
         language = metadata.get("language", DEFAULT_LANGUAGE.value)
         difficulty = metadata.get("difficulty", 3)
 
         if not game_state:
             raise RuntimeError("No game state found in store")
 
+        # Derived from the guesses, so compute them once for the whole score
+        final_word_state = game_state.current_state
+        incorrect_guesses = game_state.incorrect_guesses
+        # Joined directly rather than formatting the list's repr
+        guessed_letters = ", ".join(game_state.guessed_letters) or "none"
+
         allow_word_guesses = metadata.get("allow_word_guesses", False)
         if allow_word_guesses:
             # If word guesses are allowed and the game is not over, the agent guessed early
@@ -365,8 +469,8 @@ def game_scorer() -> Scorer:
                     f"Early guess. Word: {game_state.word}. Language: {language}. "
                     f"Difficulty: {difficulty}. "
                     f"Guessed word: {guessed_word}. "
-                    f"Guessed letters: {game_state.guessed_letters}. "
-                    f"Final word state: {game_state.current_state}. "
+                    f"Guessed letters: {guessed_letters}. "
+                    f"Final word state: {final_word_state}. "
                     f"Remaining guesses: {game_state.remaining_guesses}. "
                 )
                 return Score(
@@ -380,17 +484,17 @@ def game_scorer() -> Scorer:
                         "allow_word_guesses": allow_word_guesses,
                         "guessed_word": guessed_word,
                         "guessed_letters": game_state.guessed_letters,
-                        "final_word_state": game_state.current_state,
+                        "final_word_state": final_word_state,
                         "remaining_guesses": game_state.remaining_guesses,
-                        "incorrect_guesses": game_state.incorrect_guesses,
-                        "num_incorrect_guesses": len(game_state.incorrect_guesses),
+                        "incorrect_guesses": incorrect_guesses,
+                        "num_incorrect_guesses": len(incorrect_guesses),
                     },
                 )
 
         if not game_state.game_over:
             return Score(
                 value=INCORRECT,
-                answer=game_state.current_state,
+                answer=final_word_state,
                 explanation="The game did not complete.",
                 metadata={
                     "won": game_state.won,
@@ -398,10 +502,10 @@ def game_scorer() -> Scorer:
                     "difficulty": difficulty,
                     "allow_word_guesses": allow_word_guesses,
                     "guessed_letters": game_state.guessed_letters,
-                    "final_word_state": game_state.current_state,
+                    "final_word_state": final_word_state,
                     "remaining_guesses": game_state.remaining_guesses,
-                    "incorrect_guesses": game_state.incorrect_guesses,
-                    "num_incorrect_guesses": len(game_state.incorrect_guesses),
+                    "incorrect_guesses": incorrect_guesses,
+                    "num_incorrect_guesses": len(incorrect_guesses),
                 },
             )
 
@@ -409,14 +513,14 @@ def game_scorer() -> Scorer:
             f"Game ended. Word: {game_state.word}. Language: {language}. "
             f"Difficulty: {difficulty}. "
             f"Won: {game_state.won}. "
-            f"Guessed letters: {game_state.guessed_letters}. "
-            f"Final word state: {game_state.current_state}. "
+            f"Guessed letters: {guessed_letters}. "
+            f"Final word state: {final_word_state}. "
             f"Remaining guesses: {game_state.remaining_guesses}. "
         )
 
         return Score(
             value=CORRECT if game_state.won else INCORRECT,
-            answer=game_state.current_state,
+            answer=final_word_state,
             explanation=explanation,
             metadata={
                 "won": game_state.won,
@@ -424,10 +528,10 @@ def game_scorer() -> Scorer:
                 "difficulty": difficulty,
                 "allow_word_guesses": allow_word_guesses,
                 "guessed_letters": game_state.guessed_letters,
-                "final_word_state": game_state.current_state,
+                "final_word_state": final_word_state,
                 "remaining_guesses": game_state.remaining_guesses,
-                "incorrect_guesses": game_state.incorrect_guesses,
-                "num_incorrect_guesses": len(game_state.incorrect_guesses),
+                "incorrect_guesses": incorrect_guesses,
+                "num_incorrect_guesses": len(incorrect_guesses),
             },
         )
 
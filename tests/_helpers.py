@@ -0,0 +1,28 @@
+"""Shared helpers for reading results out of eval logs in tests."""
+
+from __future__ import annotations
+
+from inspect_ai.log import EvalLog
+
+
+def get_metrics(log: EvalLog, keys: set[str]) -> dict[str, float]:
+    """Return the "<scorer>.<metric>" values for keys, stopping once all are found.
+
+    Raises:
+        KeyError: If any of the keys is not among the log's metrics
+    """
+    assert log.results is not None
+    found: dict[str, float] = {}
+    for score in log.results.scores:
+        for metric_name, metric in score.metrics.items():
+            key = f"{score.name}.{metric_name}"
+            if key in keys:
+                found[key] = metric.value
+                if len(found) == len(keys):
+                    return found
+    raise KeyError(f"Metrics not found in log: {sorted(keys - found.keys())}")
+
+
+def get_metric(log: EvalLog, key: str) -> float:
+    """Return a single "<scorer>.<metric>" value from the log."""
+    return get_metrics(log, {key})[key]
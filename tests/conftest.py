@@ -13,10 +13,14 @@ from __future__ import annotations
 
 import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Callable, Generator
 
 import pytest
+from inspect_ai import Task
+
+from hangman_bench import hangman
 
 
 def _ensure_dir(path: Path) -> None:
@@ -41,3 +45,13 @@ def _report_log_dir() -> Generator[None, None, None]:
     if log_dir:
         print(f"[tests] INSPECT_LOG_DIR={log_dir}")
     yield
+
+
+@pytest.fixture(scope="session")
+def cached_task() -> Callable[..., Task]:
+    """Build each distinct hangman(...) task once per session.
+
+    For tests that only inspect the task; tests that run eval() on a task
+    should build their own.
+    """
+    return lru_cache(maxsize=None)(hangman)
@@ -0,0 +1,55 @@
+import bisect
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "analysis" / "bin_difficulty.py"
+
+
+@pytest.fixture(scope="module")
+def bin_difficulty():
+    spec = importlib.util.spec_from_file_location("bin_difficulty", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _bisect_labels(values, thresholds, labels):
+    return [
+        labels[min(bisect.bisect_left(thresholds, v), len(labels) - 1)] for v in values
+    ]
+
+
+@pytest.mark.parametrize(
+    "thresholds",
+    [
+        [2.0, 3.0, 4.0, 5.0],  # equispaced: arithmetic fast path
+        [0.1, 0.2, 0.3, 0.4],  # equispaced with inexact float steps
+        [1.0, 1.5, 4.0, 4.2],  # uneven: searchsorted
+    ],
+)
+def test_classify_matches_bisect_left(bin_difficulty, thresholds):
+    labels = bin_difficulty.LABELS
+    values = [-np.inf, np.inf, -1.0, 0.0, 7.5]
+    values += thresholds  # exactly on each cut
+    values += [np.nextafter(t, np.inf) for t in thresholds]
+    values += [np.nextafter(t, -np.inf) for t in thresholds]
+    values += list(np.linspace(min(thresholds) - 1, max(thresholds) + 1, 97))
+    arr = np.asarray(values, dtype=np.float64)
+
+    assert bin_difficulty.classify(arr, thresholds, labels) == _bisect_labels(
+        values, thresholds, labels
+    )
+
+
+def test_classify_labels_inf_as_hardest(bin_difficulty):
+    labels = bin_difficulty.LABELS
+    values = np.asarray([1.0, 3.0, np.inf], dtype=np.float64)
+
+    assert bin_difficulty.classify(values, [2.0, 3.0, 4.0, 5.0], labels) == [
+        "v_easy",
+        "easy",
+        "v_hard",
+    ]
@@ -1,11 +1,16 @@
 """End-to-end tests for hangman benchmark with mock models."""
 
+from typing import Any
+
 import pytest
 from inspect_ai import eval
+from inspect_ai.log import EvalLog
 from inspect_ai.model import ModelOutput, get_model
 
 from hangman_bench.hangman import hangman, _calculate_message_limit
 
+from _helpers import get_metric, get_metrics
+
 
 def create_letter_guess(letter: str) -> ModelOutput:
     """Helper function to create a ModelOutput for a hangman letter guess."""
@@ -16,87 +21,58 @@ def create_letter_guess(letter: str) -> ModelOutput:
     )
 
 
-class TestHangmanE2E:
-    """End-to-end tests for hangman benchmark using mock models."""
-
-    def test_hangman_win_easy_word(self) -> None:
-        """Test hangman win scenario with easy word and optimal guesses."""
-        # Mock model outputs for winning "apple" (difficulty 1)
-        # Strategy: guess common vowels first, then consonants
-        mock_outputs = [
-            create_letter_guess("a"),
-            create_letter_guess("e"),
-            create_letter_guess("p"),
-            create_letter_guess("l"),
-        ]
-
-        log = eval(
-            tasks=hangman(
-                language="english",
-                difficulty="v_easy",
-                max_guesses=6,
-                shuffle=False,
-            ),
-            model=get_model("mockllm/model", custom_outputs=mock_outputs),
-            limit=1,  # Test just one word
-        )[0]
-
-        assert log.status == "success"
-        assert log.results is not None
-
-        # Check that the model won the game
-        scores = {}
-        for score in log.results.scores:
-            for metric_name, metric in score.metrics.items():
-                scores[f"{score.name}.{metric_name}"] = metric.value
+def _run_eval(
+    task_kwargs: dict[str, Any], mock_outputs: list[ModelOutput], **eval_kwargs: Any
+) -> EvalLog:
+    """Run one hangman eval against the mock model and check it completed."""
+    log = eval(
+        tasks=hangman(**task_kwargs),
+        model=get_model("mockllm/model", custom_outputs=mock_outputs),
+        **eval_kwargs,
+    )[0]
 
-        # Should have overall accuracy of 1.0 (won)
-        assert "game_scorer.all" in scores
-        assert scores["game_scorer.all"] == 1.0
+    assert log.status == "success"
+    assert log.results is not None
+    return log
 
-        # Should have difficulty-v_easy accuracy of 1.0
-        assert "game_scorer.v_easy" in scores
-        assert scores["game_scorer.v_easy"] == 1.0
 
-    def test_hangman_loss_hard_word(self) -> None:
-        """Test hangman loss scenario with hard word and poor guesses."""
-        # Mock model outputs for losing on a difficult word
-        # Strategy: guess uncommon letters that likely won't be in the word
-        mock_outputs = [
-            create_letter_guess("w"),
-            create_letter_guess("q"),
-            create_letter_guess("x"),
-            create_letter_guess("j"),
-            create_letter_guess("k"),
-            # Model should lose after 5 guesses
-        ]
-
-        log = eval(
-            tasks=hangman(
-                language="english",
-                difficulty="v_hard",  # Very hard words
-                max_guesses=5,  # Limited guesses
-                shuffle=False,
-            ),
-            model=get_model("mockllm/model", custom_outputs=mock_outputs),
-            sample_id="buzzard",
-        )[0]
-
-        assert log.status == "success"
-        assert log.results is not None
-
-        scores = {}
-        for score in log.results.scores:
-            for metric_name, metric in score.metrics.items():
-                scores[f"{score.name}.{metric_name}"] = metric.value
+@pytest.mark.e2e
+class TestHangmanE2E:
+    """End-to-end tests for hangman benchmark using mock models."""
 
-        # Should have overall accuracy of 0.0 (lost)
-        assert "game_scorer.all" in scores
-        assert scores["game_scorer.all"] == 0.0
+    @pytest.mark.parametrize(
+        "difficulty,max_guesses,letters,sample_id,expected_score",
+        [
+            # Win "apple" (v_easy): guess common vowels first, then consonants
+            ("v_easy", 6, "aepl", "apple", 1.0),
+            # Lose a very hard word by guessing uncommon letters until out of guesses
+            ("v_hard", 5, "wqxjk", "buzzard", 0.0),
+        ],
+        ids=["win_easy_word", "loss_hard_word"],
+    )
+    def test_hangman_outcome(
+        self,
+        difficulty: str,
+        max_guesses: int,
+        letters: str,
+        sample_id: str,
+        expected_score: float,
+    ) -> None:
+        """Test that a won or lost game scores overall and for its difficulty."""
+        log = _run_eval(
+            {
+                "language": "english",
+                "difficulty": difficulty,
+                "max_guesses": max_guesses,
+                "shuffle": False,
+            },
+            [create_letter_guess(letter) for letter in letters],
+            sample_id=sample_id,
+        )
 
-        # Should have difficulty-v_hard accuracy of 0.0
-        assert "game_scorer.v_hard" in scores
-        assert scores["game_scorer.v_hard"] == 0.0
+        scores = get_metrics(log, {"game_scorer.all", f"game_scorer.{difficulty}"})
+        assert scores["game_scorer.all"] == expected_score
+        assert scores[f"game_scorer.{difficulty}"] == expected_score
 
     def test_hangman_mixed_results(self) -> None:
         """Test hangman with mixed win/loss results."""
@@ -116,32 +92,23 @@ class TestHangmanE2E:
             create_letter_guess("k"),
         ]
 
-        log = eval(
-            tasks=hangman(
-                language="english",
-                max_guesses=5,
-                shuffle=False,
-            ),
-            model=get_model("mockllm/model", custom_outputs=mock_outputs),
+        log = _run_eval(
+            {
+                "language": "english",
+                "max_guesses": 5,
+                "shuffle": False,
+            },
+            mock_outputs,
             sample_id=["apple", "happy"],
             max_samples=1,  # prevent parallel execution
-        )[0]
-
-        assert log.status == "success"
-        assert log.results is not None
+        )
 
-        scores = {}
-        for score in log.results.scores:
-            for metric_name, metric in score.metrics.items():
-                scores[f"{score.name}.{metric_name}"] = metric.value
+        # Should have difficulty-v_easy specific scores (raises if missing)
+        scores = get_metrics(log, {"game_scorer.all", "game_scorer.v_easy"})
 
         # Should have overall accuracy between 0.0 and 1.0 (mixed results)
-        assert "game_scorer.all" in scores
         assert 0.0 <= scores["game_scorer.all"] <= 1.0
 
-        # Should have difficulty-v_easy specific scores
-        assert "game_scorer.v_easy" in scores
-
     def test_hangman_word_guess_allowed_win(self) -> None:
         """Test hangman with word guessing allowed - early correct word guess."""
         mock_outputs = [
@@ -154,26 +121,17 @@ class TestHangmanE2E:
             ),
         ]
 
-        log = eval(
-            tasks=hangman(
-                language="english",
-                allow_word_guesses=True,
-            ),
-            model=get_model("mockllm/model", custom_outputs=mock_outputs),
+        log = _run_eval(
+            {
+                "language": "english",
+                "allow_word_guesses": True,
+            },
+            mock_outputs,
             sample_id="apple",
-        )[0]
-
-        assert log.status == "success"
-        assert log.results is not None
-
-        scores = {}
-        for score in log.results.scores:
-            for metric_name, metric in score.metrics.items():
-                scores[f"{score.name}.{metric_name}"] = metric.value
+        )
 
         # Should win with early word guess
-        assert "game_scorer.all" in scores
-        assert scores["game_scorer.all"] == 1.0
+        assert get_metric(log, "game_scorer.all") == 1.0
 
     def test_hangman_word_guess_allowed_wrong_word(self) -> None:
         """Test hangman with word guessing allowed - wrong word guess."""
@@ -186,28 +144,19 @@ class TestHangmanE2E:
             ),
         ]
 
-        log = eval(
-            tasks=hangman(
-                language="english",
-                difficulty="v_easy",
-                allow_word_guesses=True,
-                shuffle=False,
-            ),
-            model=get_model("mockllm/model", custom_outputs=mock_outputs),
-            limit=1,
-        )[0]
-
-        assert log.status == "success"
-        assert log.results is not None
-
-        scores = {}
-        for score in log.results.scores:
-            for metric_name, metric in score.metrics.items():
-                scores[f"{score.name}.{metric_name}"] = metric.value
+        log = _run_eval(
+            {
+                "language": "english",
+                "difficulty": "v_easy",
+                "allow_word_guesses": True,
+                "shuffle": False,
+            },
+            mock_outputs,
+            sample_id="apple",
+        )
 
         # Should lose with wrong word guess
-        assert "game_scorer.all" in scores
-        assert scores["game_scorer.all"] == 0.0
+        assert get_metric(log, "game_scorer.all") == 0.0
 
     def test_hangman_incomplete_game(self) -> None:
         """Test hangman when game doesn't complete (model stops early)."""
@@ -222,13 +171,13 @@ class TestHangmanE2E:
         expected_limit = _calculate_message_limit(len("butterfly"), max_guesses)
         assert expected_limit == 44
 
-        log = eval(
-            tasks=hangman(
-                max_guesses=max_guesses,
-            ),
-            model=get_model("mockllm/model", custom_outputs=mock_outputs),
+        log = _run_eval(
+            {
+                "max_guesses": max_guesses,
+            },
+            mock_outputs,
             sample_id="apple",
-        )[0]
+        )
 
         assert log.samples is not None
         assert log.samples[0].messages[-1].role == "user"
@@ -240,46 +189,8 @@ class TestHangmanE2E:
         assert log.samples[0].limit.limit == expected_limit
         # assert log.messages[-1].content == "Game terminated after 10 messages"
 
-        assert log.status == "success"
-        assert log.results is not None
-
-        scores = {}
-        for score in log.results.scores:
-            for metric_name, metric in score.metrics.items():
-                scores[f"{score.name}.{metric_name}"] = metric.value
-
         # Incomplete game should result in loss (score = 0.0)
-        assert "game_scorer.all" in scores
-        assert scores["game_scorer.all"] == 0.0
-
-    def test_hangman_invalid_language(self) -> None:
-        """Test that invalid language raises ValueError."""
-        with pytest.raises(
-            ValueError, match="Language 'invalid_language' not supported"
-        ):
-            hangman(language="invalid_language")
-
-    def test_hangman_task_parameters(self) -> None:
-        """Test that task parameters are correctly set."""
-        # Test with specific parameters
-        task = hangman(
-            language="english",
-            difficulty="medium",
-            max_guesses=8,
-            allow_word_guesses=True,
-            shuffle=False,
-        )
-
-        assert task is not None
-        assert len(task.dataset) > 0
-
-        # All samples should have difficulty 3
-        for sample in task.dataset:
-            metadata = sample.metadata or {}
-            assert metadata["difficulty"] == "medium"
-            assert metadata["max_guesses"] == 8
-            assert metadata["language"] == "english"
-            assert metadata["allow_word_guesses"] is True
+        assert get_metric(log, "game_scorer.all") == 0.0
 
     def test_hangman_scoring_metrics(self) -> None:
         """Test that scoring includes expected metrics."""
@@ -292,19 +203,16 @@ class TestHangmanE2E:
             ),
         ]
 
-        log = eval(
-            tasks=hangman(
-                language="english",
-                difficulty=None,  # Mixed difficulties
-                allow_word_guesses=True,
-                shuffle=False,
-            ),
-            model=get_model("mockllm/model", custom_outputs=mock_outputs),
-            limit=1,
-        )[0]
-
-        assert log.status == "success"
-        assert log.results is not None
+        log = _run_eval(
+            {
+                "language": "english",
+                "difficulty": None,  # Mixed difficulties
+                "allow_word_guesses": True,
+                "shuffle": False,
+            },
+            mock_outputs,
+            sample_id="apple",
+        )
 
         # Check that we have grouped scoring by difficulty
         score_names = [score.name for score in log.results.scores]
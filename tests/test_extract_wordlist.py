@@ -0,0 +1,33 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "analysis" / "extract_wordlist.py"
+
+
+@pytest.fixture(scope="module")
+def extract():
+    spec = importlib.util.spec_from_file_location("extract_wordlist", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.extract
+
+
+@pytest.mark.parametrize("header", ["word", "Word", " word ", "WORD"])
+def test_extract_skips_word_header(extract, tmp_path, header):
+    src = tmp_path / "in.tsv"
+    src.write_text(f"id\t{header}\n1\tApple\n2\tbanana\n3\tapple\n", encoding="utf-8")
+    dst = tmp_path / "out.txt"
+
+    assert extract(str(src), str(dst)) == 2
+    assert dst.read_text(encoding="utf-8") == "apple\nbanana\n"
+
+
+def test_extract_without_header_uses_first_column(extract, tmp_path):
+    src = tmp_path / "in.tsv"
+    src.write_text("Cherry\t1\nplum\t2\n", encoding="utf-8")
+    dst = tmp_path / "out.txt"
+
+    assert extract(str(src), str(dst)) == 2
+    assert dst.read_text(encoding="utf-8") == "cherry\nplum\n"
@@ -6,6 +6,9 @@ from hangman_bench.datasets import (
     get_words_by_difficulty,
     get_words_by_language,
 )
+from hangman_bench.hangman import GameState
+
+REQUIRED_METADATA = frozenset({"word", "difficulty", "language", "max_guesses"})
 
 
 def test_get_words_by_language():
@@ -20,61 +23,100 @@ def test_get_words_by_difficulty():
     assert all(word.difficulty == "v_easy" for word in easy_words)
 
 
-def test_task_creation_with_defaults():
-    task = hangman()
+def test_task_creation_with_defaults(cached_task):
+    task = cached_task()
     assert task is not None
     assert len(task.dataset) > 0
 
 
-def test_task_creation_with_difficulty():
-    task = hangman(difficulty="medium")
+def test_task_creation_with_difficulty(cached_task):
+    task = cached_task(difficulty="medium")
     assert len(task.dataset) > 0
     for sample in task.dataset:
         metadata = sample.metadata or {}
         assert metadata["difficulty"] == "medium"
 
 
-def test_hangman_task_creation_with_parameters():
-    task = hangman(language="english", difficulty="easy", max_guesses=6)
+def test_hangman_task_creation_with_parameters(cached_task):
+    task = cached_task(language="english", difficulty="easy", max_guesses=6)
     assert task is not None
     assert len(task.dataset) > 0
 
 
-def test_hangman_invalid_language():
-    with pytest.raises(ValueError, match="Language .* not supported"):
-        hangman(language="invalid")
-
-
-def test_hangman_invalid_difficulty():
-    with pytest.raises(ValueError, match="Difficulty must be one of"):
-        hangman(difficulty=6)  # Invalid difficulty
-    with pytest.raises(ValueError, match="Difficulty must be one of"):
-        hangman(difficulty="shmedium")  # Invalid difficulty
-
-
-def test_dataset_structure():
-    """Test that the dataset has the expected structure."""
-    task = hangman(language="english", difficulty="v_easy")
+def test_hangman_task_parameters(cached_task):
+    """Test that task parameters are correctly set."""
+    task = cached_task(
+        language="english",
+        difficulty="medium",
+        max_guesses=8,
+        allow_word_guesses=True,
+        shuffle=False,
+    )
 
+    assert task is not None
     assert len(task.dataset) > 0
 
     for sample in task.dataset:
-        # Check sample has required fields
-        assert sample.input is not None
-        assert sample.target is not None
-        assert sample.metadata is not None
-
-        # Check metadata structure
-        metadata = sample.metadata
-        assert "word" in metadata
-        assert "difficulty" in metadata
-        assert "language" in metadata
-        assert "max_guesses" in metadata
-
-        # Validate metadata values
-        assert isinstance(metadata["word"], str)
-        assert len(metadata["word"]) > 0
-        assert metadata["difficulty"] == "v_easy"
+        metadata = sample.metadata or {}
+        assert metadata["difficulty"] == "medium"
+        assert metadata["max_guesses"] == 8
         assert metadata["language"] == "english"
-        assert isinstance(metadata["max_guesses"], int)
-        assert metadata["max_guesses"] > 0
+        assert metadata["allow_word_guesses"] is True
+
+
+@pytest.mark.parametrize(
+    "kwargs,message",
+    [
+        ({"language": "invalid"}, "Language .* not supported"),
+        ({"language": "invalid_language"}, "Language 'invalid_language' not supported"),
+        *(
+            ({"difficulty": bad}, "Difficulty must be one of")
+            for bad in [0, 6, -1, "shmedium", "Medium"]
+        ),
+    ],
+)
+def test_hangman_rejects_invalid(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        hangman(**kwargs)
+
+
+def test_dataset_structure(cached_task):
+    """Test that the dataset has the expected structure."""
+    task = cached_task(language="english", difficulty="v_easy")
+    samples = list(task.dataset)
+
+    assert len(samples) > 0
+
+    # Check samples have required fields
+    assert all(sample.input is not None for sample in samples)
+    assert all(sample.target is not None for sample in samples)
+    metadatas = [sample.metadata for sample in samples]
+    assert all(metadata is not None for metadata in metadatas)
+
+    # Check metadata structure
+    assert all(REQUIRED_METADATA <= metadata.keys() for metadata in metadatas)
+
+    # Validate metadata values
+    words = [metadata["word"] for metadata in metadatas]
+    assert all(isinstance(word, str) and len(word) > 0 for word in words)
+    assert {metadata["difficulty"] for metadata in metadatas} == {"v_easy"}
+    assert {metadata["language"] for metadata in metadatas} == {"english"}
+    max_guesses = [metadata["max_guesses"] for metadata in metadatas]
+    assert all(isinstance(n, int) and n > 0 for n in max_guesses)
+
+
+def test_game_state_guesses():
+    game = GameState.start("Banana", max_guesses=3)
+    for letter in "xAzx":  # repeated and upper-case guesses count once
+        game.guess(letter)
+
+    assert game.guessed_letters == ["x", "a", "z"]
+    assert game.incorrect_guesses == ["x", "z"]
+    assert game.current_state == "_ a _ a _ a"
+    assert game.remaining_guesses == 1
+    assert not game.game_over
+
+    game.guess("n")
+    game.guess("b")
+    assert game.current_state == "b a n a n a"
+    assert game.game_over and game.won